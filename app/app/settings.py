@@ -152,11 +152,17 @@ TEMPLATES = [
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
             ],
+            # Parse each template once per process, reset by runserver on changes
             "loaders": [
-                "django.template.loaders.filesystem.Loader",
-                "django.template.loaders.app_directories.Loader",
-                "admin_tools.template_loaders.Loader",
-                "utils.loaders.SQLLoader",
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                        "admin_tools.template_loaders.Loader",
+                        "utils.loaders.SQLLoader",
+                    ],
+                )
             ],
         },
     },
@@ -194,6 +200,9 @@ POSTGRES_COUNT_TEST_QUERIES = environ_bool("POSTGRES_COUNT_TEST_QUERIES", 0)
 POSTGRES_SHOW_TEST_QUERIES = environ_bool("POSTGRES_SHOW_TEST_QUERIES", 0)
 """If True, will show the queries captured after each unit test."""
 
+POSTGRES_CSV_UPLOAD_COPY = environ_bool("POSTGRES_CSV_UPLOAD_COPY", 0)
+"""If True, csv uploads will insert new objects using COPY instead of INSERT."""
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -55,7 +55,9 @@ def on_save_team(sender, instance: Team, created=False, **kwargs):
         )
 
 
-@receiver([post_save, post_delete])
+# Senders are listed so other models can still be saved in bulk
+@receiver([post_save, post_delete], sender=Club)
+@receiver([post_save, post_delete], sender=ClubTag)
 def refresh_preview_cache(sender, instance: Club | ClubTag, created=False, **kwargs):
     """Refreshes the club preview cache when clubs are changed"""
 
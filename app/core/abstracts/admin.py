@@ -268,6 +268,18 @@ class InlineBase(AdminBase):
     extra = 0
     formfield_overrides = {}
 
+    prefetch_related_fields = ()
+    """Makes another query to select a set of related objects."""
+    select_related_fields = ()
+    """Uses SQL Join to select a single related object."""
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+
+        return qs.prefetch_related(*self.prefetch_related_fields).select_related(
+            *self.select_related_fields
+        )
+
 
 class StackedInlineBase(InlineBase, admin.StackedInline):
     """Display fk related objects as cards, form flowing down."""
@@ -1,6 +1,7 @@
 import copy
 from enum import Enum
 from time import sleep
+from typing import Optional
 
 import requests
 from django.contrib.auth.models import Permission
@@ -426,13 +427,12 @@ class ImageUrlField(serializers.Field):
         except Exception:
             return None
 
-    def to_internal_value(self, data):
-        self.url_validator(data)
+    @staticmethod
+    def download(url: str, session: Optional[requests.Session] = None, stream=True):
+        """Get response for url, retrying if the request is unsuccessful."""
 
-        res = requests.get(
-            data,
-            stream=True,
-        )
+        client = session if session is not None else requests
+        res = client.get(url, stream=stream)
 
         retries = 3
         while res.status_code > 300:
@@ -441,9 +441,27 @@ class ImageUrlField(serializers.Field):
 
             sleep(2)
 
-            res = requests.get(data, stream=True)
+            res = client.get(url, stream=stream)
             retries = retries - 1
 
+        return res
+
+    def to_internal_value(self, data):
+        self.url_validator(data)
+
+        # Responses can be downloaded ahead of time, see ``QueryCsvService``
+        prefetched_images = self.context.get("prefetched_images", None) or {}
+
+        if data in prefetched_images:
+            res = prefetched_images[data]
+        else:
+            res = self.download(data)
+
+        # Prefetched downloads store the error raised instead of a response,
+        # a new error is raised so the stored one is not changed for each row
+        if isinstance(res, Exception):
+            raise ValueError(f"Failed to download url {data}: {res}") from res
+
         if not res.status_code < 300:
             raise ValueError(
                 f"Expected url {data} to return 200, but returned {res.status_code}"
@@ -6,6 +6,32 @@ from django.template.loader import render_to_string
 from django.utils.html import strip_tags
 
 
+def build_html_mail(
+    subject: str,
+    to: list[str],
+    html_template: str,
+    html_context: Optional[dict] = None,
+    from_email: Optional[str] = None,
+    text_body=None,
+):
+    """Create HTML email using mail.EmailMultiAlternatives class, without sending."""
+
+    html_body = render_to_string(html_template, context=html_context)
+
+    text_body = text_body or strip_tags(html_body)
+    from_email = from_email or DEFAULT_FROM_EMAIL
+
+    message = mail.EmailMultiAlternatives(
+        from_email=from_email,
+        subject=subject,
+        body=text_body,
+        to=to,
+    )
+    message.attach_alternative(html_body, "text/html")
+
+    return message
+
+
 def send_html_mail(
     subject: str,
     to: list[str],
@@ -22,27 +48,27 @@ def send_html_mail(
     in the email app's "to" field).
     """
 
-    html_body = render_to_string(html_template, context=html_context)
+    message = build_html_mail(
+        subject=subject,
+        to=to,
+        html_template=html_template,
+        html_context=html_context,
+        from_email=from_email,
+        text_body=text_body,
+    )
 
-    text_body = text_body or strip_tags(html_body)
-    from_email = from_email or DEFAULT_FROM_EMAIL
+    if not send_separately:
+        message.send()
+        return
 
-    if send_separately:
-        for email in to:
-            message = mail.EmailMultiAlternatives(
-                from_email=from_email,
-                subject=subject,
-                body=text_body,
-                to=[email],
-            )
-            message.attach_alternative(html_body, "text/html")
-            message.send()
-    else:
-        message = mail.EmailMultiAlternatives(
-            from_email=from_email,
-            subject=subject,
-            body=text_body,
-            to=to,
-        )
-        message.attach_alternative(html_body, "text/html")
+    # Template is only rendered once, each recipient gets their own email
+    for email in to:
+        message.to = [email]
         message.send()
+
+
+def send_mass_html_mail(messages: list[mail.EmailMessage]):
+    """Send multiple emails using a single connection to the mail server."""
+
+    with mail.get_connection() as connection:
+        return connection.send_messages(messages)
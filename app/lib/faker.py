@@ -14,4 +14,4 @@ class CustomFaker(Faker):
 
 fake = CustomFaker("en_US")
 
-__all__ = ["fake"]
+__all__ = ["fake", "CustomFaker"]
@@ -19,8 +19,41 @@ def read_spreadsheet(file: File):
         data = json.load(file.open(mode="r"))
         df = pd.json_normalize(data)
     else:
-        df = pd.read_csv(file.open(mode="r"), dtype=str)
+        # Empty cells are read as empty strings, skips checking cells for NaN
+        return pd.read_csv(
+            file.open(mode="r"),
+            dtype=str,
+            engine="c",
+            na_filter=False,
+            keep_default_na=False,
+        )
 
     df.replace(np.nan, "", inplace=True)
 
     return df
+
+
+def iter_spreadsheet(file: File, chunksize: int = 10_000):
+    """
+    Import spreadsheet from filepath, yielding dataframes of up to
+    ``chunksize`` rows.
+
+    Csv files are read incrementally, other formats are read at once
+    and yielded as a single dataframe.
+    """
+
+    path = file.name
+
+    if path.endswith((".xlsx", ".xls", ".json")):
+        yield read_spreadsheet(file)
+        return
+
+    with pd.read_csv(
+        file.open(mode="r"),
+        dtype=str,
+        engine="c",
+        na_filter=False,
+        keep_default_na=False,
+        chunksize=chunksize,
+    ) as reader:
+        yield from reader
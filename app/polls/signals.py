@@ -80,7 +80,12 @@ def on_delete_poll_submission(sender, instance: PollSubmission, **kwargs):
     )
 
 
-@receiver([post_save, post_delete])
+# Senders are listed so other models can still be saved in bulk
+@receiver([post_save, post_delete], sender=Poll)
+@receiver([post_save, post_delete], sender=Event)
+@receiver([post_save, post_delete], sender=Club)
+@receiver([post_save, post_delete], sender=PollField)
+@receiver([post_save, post_delete], sender=PollSubmissionLink)
 def refresh_poll_preview_cache(
     sender,
     instance: Poll | Event | Club | PollField | PollSubmissionLink,
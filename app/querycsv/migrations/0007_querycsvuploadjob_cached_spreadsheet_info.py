@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-17 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("querycsv", "0006_alter_querycsvuploadjob_file"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="querycsvuploadjob",
+            name="cached_spreadsheet_info",
+            field=models.JSONField(
+                blank=True,
+                editable=False,
+                help_text="Row count and headers of the uploaded file, used to avoid re-reading it",
+                null=True,
+            ),
+        ),
+    ]
@@ -39,6 +39,12 @@ class FieldMappingType(TypedDict):
     field_name: str
 
 
+class SpreadsheetInfoType(TypedDict):
+    file: str
+    row_count: int
+    headers: list[str]
+
+
 class QueryCsvUploadJobManager(ManagerBase["QueryCsvUploadJob"]):
     """Model manager for queryset csvs."""
 
@@ -94,6 +100,12 @@ class QueryCsvUploadJob(ModelBase):
     logs = models.JSONField(null=True, blank=True, editable=False)
     started_at = models.DateTimeField(null=True, blank=True, editable=False)
     ended_at = models.DateTimeField(null=True, blank=True, editable=False)
+    cached_spreadsheet_info = models.JSONField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Row count and headers of the uploaded file, used to avoid re-reading it",
+    )
 
     # Overrides
     objects: ClassVar[QueryCsvUploadJobManager] = QueryCsvUploadJobManager()
@@ -113,7 +125,7 @@ class QueryCsvUploadJob(ModelBase):
     # Dynamic properties
     @cached_property
     def display_name(self):
-        if self.spreadsheet is not None and not self.spreadsheet.empty:
+        if self.row_count > 0:
             return f'Upload for "{self.object_type}" objects, {self.row_count} rows'
         else:
             return f'Upload for "{self.object_type}" objects'
@@ -132,10 +144,40 @@ class QueryCsvUploadJob(ModelBase):
             self.save()
             return None
 
+    @property
+    def spreadsheet_info(self) -> Optional[SpreadsheetInfoType]:
+        """
+        Row count and headers of the spreadsheet.
+
+        Uses the info saved by ``update_spreadsheet_info`` so listing or
+        rerunning the job does not read the file again, otherwise the file
+        is read without saving the job.
+        """
+
+        if not self._is_spreadsheet_info_stale:
+            return self.cached_spreadsheet_info
+
+        return self._get_spreadsheet_info()
+
+    @property
+    def _is_spreadsheet_info_stale(self):
+        info = self.cached_spreadsheet_info
+        return info is None or info["file"] != self.file.name
+
+    def _get_spreadsheet_info(self) -> Optional[SpreadsheetInfoType]:
+        if self.spreadsheet is None:
+            return None
+
+        return {
+            "file": self.file.name,
+            "row_count": len(self.spreadsheet.index),
+            "headers": list(self.spreadsheet.columns),
+        }
+
     @cached_property
     def row_count(self):
-        if self.spreadsheet is not None:
-            return len(self.spreadsheet.index)
+        if self.spreadsheet_info is not None:
+            return self.spreadsheet_info["row_count"]
         else:
             return 0
 
@@ -170,8 +212,8 @@ class QueryCsvUploadJob(ModelBase):
 
     @cached_property
     def csv_headers(self):
-        if self.spreadsheet is not None:
-            return list(self.spreadsheet.columns)
+        if self.spreadsheet_info is not None:
+            return self.spreadsheet_info["headers"]
         else:
             return []
 
@@ -188,6 +230,17 @@ class QueryCsvUploadJob(ModelBase):
         self.ended_at = timezone.now()
         self.save()
 
+    def update_spreadsheet_info(self, commit=True):
+        """Save row count and headers if missing, or if the file changed."""
+
+        if not self._is_spreadsheet_info_stale:
+            return
+
+        self.cached_spreadsheet_info = self._get_spreadsheet_info()
+
+        if commit:
+            self.save(update_fields=["cached_spreadsheet_info", "updated_at"])
+
     def add_log(self, msg: str, key: Optional[str] = None, commit=True):
         """Add log to json field."""
 
@@ -207,18 +260,35 @@ class QueryCsvUploadJob(ModelBase):
         self.save()
 
     def add_field_mapping(self, column_name: str, field_name: str, commit=True):
-        """Add custom field mapping."""
+        """
+        Add custom field mapping.
 
-        if self.spreadsheet is not None:
-            column_options = list(self.spreadsheet.columns)
+        The mapping is added to ``custom_field_mappings`` in place, so the
+        job does not need to be refreshed after saving.
+        """
 
-            assert column_name in column_options, (
-                f"The name {column_name} is not in available columns: {', '.join(column_options)}"
-            )
+        self.add_field_mappings(
+            [{"column_name": column_name, "field_name": field_name}], commit=commit
+        )
+
+    def add_field_mappings(self, mappings: list[FieldMappingType], commit=True):
+        """Add multiple custom field mappings, saving the job once."""
+
+        if self.spreadsheet_info is not None:
+            column_options = self.csv_headers
+
+            for mapping in mappings:
+                assert mapping["column_name"] in column_options, (
+                    f"The name {mapping['column_name']} is not in available columns: {', '.join(column_options)}"
+                )
 
-        self.custom_field_mappings["fields"].append(
-            {"column_name": column_name, "field_name": field_name}
+        if self.custom_field_mappings is None:
+            self.custom_field_mappings = {"fields": []}
+
+        self.custom_field_mappings["fields"].extend(
+            {"column_name": mapping["column_name"], "field_name": mapping["field_name"]}
+            for mapping in mappings
         )
 
         if commit:
-            self.save()
+            self.save(update_fields=["custom_field_mappings", "updated_at"])
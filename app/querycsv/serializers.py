@@ -1,10 +1,14 @@
 import re
 import traceback
 from collections.abc import Iterable
+from functools import cache
 from typing import Optional
 
+from core.abstracts.models import CustomManagerMethods, ModelBase
 from core.abstracts.serializers import FieldType, ModelSerializerBase, SerializerBase
+from django.core.exceptions import FieldDoesNotExist
 from django.db import models
+from django.db.models import signals
 from rest_framework import serializers
 from rest_framework.fields import empty
 from rest_framework.relations import SlugRelatedField
@@ -123,6 +127,44 @@ class FlatListField(FlatField):
             self.key += f".{self.sub_key}"
 
 
+@cache
+def get_flat_schema(serializer_class: type["FlatSerializer"]):
+    """
+    Get a blank serializer and its flat fields for a serializer class.
+
+    Shared between calls, the returned serializer and fields are read-only.
+    """
+
+    serializer = serializer_class()
+    return serializer, serializer.get_flat_fields()
+
+
+def can_bulk_save(model: type[models.Model]) -> bool:
+    """
+    Whether objects for a model can be saved with bulk queries.
+
+    Bulk queries do not call the model's ``save`` or the manager's
+    ``create``, and do not send ``pre_save`` or ``post_save``.
+    """
+
+    if model.save not in (ModelBase.save, models.Model.save) or model._meta.parents:
+        return False
+
+    if signals.pre_save.has_listeners(model) or signals.post_save.has_listeners(model):
+        return False
+
+    # Managers forward ``create`` to the queryset unless they override it
+    for cls in type(model._default_manager).__mro__:
+        method = cls.__dict__.get("create", None)
+
+        if method is None or cls is CustomManagerMethods:
+            continue
+
+        return getattr(method, "__wrapped__", None) is models.QuerySet.create
+
+    return True
+
+
 class FlatSerializer(SerializerBase):
     """Convert between json data and flattened data."""
 
@@ -259,7 +301,7 @@ class FlatSerializer(SerializerBase):
         """
 
         parsed = {}
-        self = cls()
+        self, flat_fields = get_flat_schema(cls)
 
         # For each field, convert flattened syntax to JSON representation
         for key, value in record.items():
@@ -267,7 +309,11 @@ class FlatSerializer(SerializerBase):
             list_objs_res = re.match(r"([a-z0-9_-]+)\[([0-9]+)\]\.?(.*)?", key)
             nested_obj_res = re.match(r"([a-z0-9_-]+)\.(.*)", key)
 
-            field = self.get_flat_field(key)
+            # Same lookup as ``get_flat_field``, without rebuilding flat fields
+            field = flat_fields.get(key)
+            if field is None and bool(list_objs_res):
+                field = flat_fields.get(re.sub(FlatListField.list_pattern, "[n]", key))
+                field = field if field is not None and field.is_list_item else None
 
             if field is not None:
                 value = field.parse_value(value)
@@ -376,18 +422,24 @@ class CsvModelSerializer(FlatSerializer, ModelSerializerBase):
             ModelClass = self.model_class
             search_query = None
 
+            # Field introspection is shared between rows
+            schema, _ = get_flat_schema(type(self))
+
             # Check pk if pk value exists, short circuiting if it does
-            pk_value = data.get(self.pk_field, None)
+            pk_value = data.get(schema.pk_field, None)
             if pk_value is not None:
-                self.instance = ModelClass.objects.get(id=pk_value)
+                self.instance = self._get_prefetched_instance(
+                    schema.pk_field, pk_value
+                ) or ModelClass.objects.get(id=pk_value)
                 return
 
             unique_data_fields = [
-                field for field in self.unique_fields if field in data.keys()
+                field for field in schema.unique_fields if field in data.keys()
             ]
+            exact_lookups = []
 
             # Find object containing all unique fields (AND)
-            for field in self.unique_fields:
+            for field in schema.unique_fields:
                 value = data.get(field, None)
 
                 # Remove leading/trailing spaces before processing
@@ -401,8 +453,10 @@ class CsvModelSerializer(FlatSerializer, ModelSerializerBase):
 
                 # Allow updating unique fields if not set, but only if
                 # there's another unique field to use as a lookup
-                if field not in self.required_fields and len(unique_data_fields) > 1:
+                if field not in schema.required_fields and len(unique_data_fields) > 1:
                     query = query | models.Q(**{f"{field}": None})
+                else:
+                    exact_lookups.append((field, value))
 
                 if search_query is None:
                     search_query = query
@@ -411,7 +465,7 @@ class CsvModelSerializer(FlatSerializer, ModelSerializerBase):
 
             # Find object containing all sets of unique_together fields (AND)
             # FIXME: This will probably break for fields greater than 2
-            for field_1, field_2 in self.unique_together_fields:
+            for field_1, field_2 in schema.unique_together_fields:
                 values = {
                     field_1: data.get(field_1, None),
                     field_2: data.get(field_2, None),
@@ -426,8 +480,8 @@ class CsvModelSerializer(FlatSerializer, ModelSerializerBase):
                     elif isinstance(value, str):
                         value = value.strip()
 
-                    if f in self.related_fields:
-                        values[f] = self.get_fields()[f].to_internal_value(values[f])
+                    if f in schema.related_fields:
+                        values[f] = self.fields[f].to_internal_value(values[f])
 
                 # TODO: Test query functionality
                 query_all_fields = models.Q(**{field_1: values[field_1]}) & models.Q(
@@ -452,13 +506,33 @@ class CsvModelSerializer(FlatSerializer, ModelSerializerBase):
                 else:
                     search_query = search_query & query
 
-            query = ModelClass.objects.filter(search_query)
-            if query.exists():
-                self.instance = query.first()
+            # Single exact lookups can use objects prefetched by the caller
+            if len(exact_lookups) == 1 and search_query == models.Q(
+                **{f"{exact_lookups[0][0]}__exact": exact_lookups[0][1]}
+            ):
+                instance = self._get_prefetched_instance(*exact_lookups[0])
+
+                if instance is not None:
+                    self.instance = instance
+                    return
+
+            self.instance = ModelClass.objects.filter(search_query).first()
 
         except Exception:
             pass
 
+    def _get_prefetched_instance(self, field: str, value):
+        """
+        Get instance from ``prefetched_instances`` in the serializer context.
+
+        The context value is a dict of unique field names to dicts mapping
+        string values to instances, for example ``{"id": {"1": obj}}``.
+        """
+
+        prefetched = self.context.get("prefetched_instances", None) or {}
+
+        return prefetched.get(field, {}).get(str(value).strip(), None)
+
     def to_internal_value(self, data):
         # Why run initialization here?
         # This is one of the internal methods that is called first when running
@@ -472,20 +546,97 @@ class CsvModelSerializer(FlatSerializer, ModelSerializerBase):
         """Parses m2m values for create/update methods."""
 
         if islistinstance(value, dict):
-            model = field.model
-            saved_objs = []
-
-            for nested_obj in value:
-                obj, _ = model._default_manager.get_or_create(**nested_obj)
-                saved_objs.append(obj)
-
-            value = saved_objs
+            value = self._get_or_create_nested(field.model, value)
 
         if not isinstance(value, Iterable):
             value = [value]
 
         return value
 
+    def _get_or_create_nested(self, model: type[models.Model], objects: list[dict]):
+        """
+        Like calling ``get_or_create`` for each object, but finds existing
+        objects with one query and creates the missing ones with one query.
+
+        Objects are only saved in bulk if they only set simple fields on a
+        model without custom save logic or save signals, otherwise
+        ``get_or_create`` is used.
+        """
+
+        manager = model._default_manager
+
+        if not self._can_bulk_create_nested(model, objects):
+            return [manager.get_or_create(**nested_obj)[0] for nested_obj in objects]
+
+        def get_key(nested_obj: dict):
+            return tuple(
+                sorted(
+                    (key, model._meta.get_field(key).to_python(value))
+                    for key, value in nested_obj.items()
+                )
+            )
+
+        search_query = models.Q()
+        for nested_obj in objects:
+            search_query |= models.Q(**nested_obj)
+
+        # Existing object for each set of values, like ``get_or_create`` this
+        # raises if a set of values matches more than one object
+        saved_objs = {}
+        keys = [get_key(nested_obj) for nested_obj in objects]
+        unique_keys = set(keys)
+        for obj in manager.filter(search_query):
+            for key in unique_keys:
+                if not all(
+                    getattr(obj, field_name) == value for field_name, value in key
+                ):
+                    continue
+
+                if key in saved_objs:
+                    raise model.MultipleObjectsReturned(
+                        f"Found more than one {model._meta.object_name} "
+                        f"matching {dict(key)}."
+                    )
+
+                saved_objs[key] = obj
+
+        new_objs = {}
+        for key, nested_obj in zip(keys, objects, strict=True):
+            if key in saved_objs or key in new_objs:
+                continue
+
+            obj = model(**nested_obj)
+            # Same validation that runs in ``ModelBase.save``
+            obj.full_clean()
+            new_objs[key] = obj
+
+        if len(new_objs) > 0:
+            manager.bulk_create(new_objs.values())
+            saved_objs.update(new_objs)
+
+        return [saved_objs[key] for key in keys]
+
+    def _can_bulk_create_nested(self, model: type[models.Model], objects: list[dict]):
+        """Whether nested objects can be found and created in bulk."""
+
+        if not can_bulk_save(model):
+            return False
+
+        for nested_obj in objects:
+            if len(nested_obj) == 0:
+                return False
+
+            for key in nested_obj.keys():
+                try:
+                    model_field = model._meta.get_field(key)
+                except FieldDoesNotExist:
+                    return False
+
+                if not model_field.concrete or model_field.is_relation:
+                    return False
+
+        return True
+
     def _get_remote_field_name(self, field_name):
         """Get the field name a foreign model uses to reference this object."""
         ModelClass = self.Meta.model
@@ -757,14 +908,75 @@ class WritableSlugRelatedField(SlugRelatedField):
 
         self.extra_kwargs = extra_kwargs or {}
 
+    @property
+    def cache_key(self):
+        """
+        Identifies objects this field can share with other fields, or None
+        if the queryset cannot be shared.
+
+        Computed once per queryset. Fields with the same model, slug field,
+        and filters share objects, without compiling the queryset's sql.
+        """
+
+        queryset = self.queryset
+
+        if getattr(self, "_cache_key_queryset", None) is not queryset:
+            self._cache_key_queryset = queryset
+            self._cache_key = self._get_cache_key(queryset)
+
+        return self._cache_key
+
+    def _get_cache_key(self, queryset: Optional[models.QuerySet]):
+        # Empty querysets are usually replaced per row, like in ``__init__``
+        if queryset is None or queryset.query.is_empty():
+            return None
+
+        where = queryset.query.where
+
+        try:
+            hash(where)
+        except TypeError:
+            return None
+
+        return (queryset.model._meta.label, self.slug_field, where)
+
+    def get_cached_instances(self) -> Optional[dict]:
+        """
+        Objects shared by serializers using the same context, mapping
+        string slug values to instances.
+
+        Enabled by setting ``related_instances`` to a dict in the context.
+        """
+
+        related_instances = self.context.get("related_instances", None)
+
+        if related_instances is None or self.extra_kwargs:
+            return None
+
+        cache_key = self.cache_key
+
+        if cache_key is None:
+            return None
+
+        return related_instances.setdefault(cache_key, {})
+
     def to_internal_value(self, data):
         """Overrides default behavior to create if not found."""
+        cached_instances = self.get_cached_instances()
+
+        if cached_instances is not None and str(data) in cached_instances:
+            return cached_instances[str(data)]
+
         queryset = self.get_queryset()
 
         try:
             obj, _ = queryset.get_or_create(
                 **{self.slug_field: data}, **self.extra_kwargs
             )
+
+            if cached_instances is not None:
+                cached_instances[str(data)] = obj
+
             return obj
         except (TypeError, ValueError) as e:
             print(e)
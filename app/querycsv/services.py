@@ -1,20 +1,49 @@
 import re
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from io import BytesIO
+from itertools import batched
+from threading import Lock
 from typing import Literal, Optional, TypedDict
 
 import pandas as pd
-from core.abstracts.serializers import ModelSerializerBase
+import requests
+from core.abstracts.serializers import ImageUrlField, ModelSerializerBase
+from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.core.files import File
-from django.db import models
+from django.core.validators import URLValidator
+from django.db import (
+    DatabaseError,
+    IntegrityError,
+    connections,
+    models,
+    transaction,
+)
+from django.db.models.fields import AutoFieldMixin
 from django.utils import timezone
-from lib.spreadsheets import read_spreadsheet
+from django.utils.functional import cached_property
+from lib.spreadsheets import iter_spreadsheet
+from requests.adapters import HTTPAdapter
+from rest_framework.relations import ManyRelatedField
+from rest_framework.serializers import (
+    BaseSerializer,
+    ListSerializer,
+    ModelSerializer,
+    Serializer,
+)
 from utils.helpers import str_to_list
 from utils.logging import print_error
 
 from querycsv.models import CsvUploadStatus, QueryCsvUploadJob
-from querycsv.serializers import CsvModelSerializer
+from querycsv.serializers import (
+    CsvModelSerializer,
+    FlatListField,
+    WritableSlugRelatedField,
+    can_bulk_save,
+    get_flat_schema,
+)
 
 
 class FieldMappingType(TypedDict):
@@ -29,14 +58,32 @@ class QueryCsvService:
         SKIP = "SKIP"
         CF = "CUSTOM_FIELD"
 
+    batch_size = 1000
+    """Max number of rows to save in a single bulk query."""
+
+    chunk_size = 10_000
+    """Max number of csv rows to read into memory at once."""
+
+    image_download_workers = 16
+    """Max number of images to download at the same time."""
+
+    image_prefetch_max_bytes = 100 * 1024 * 1024
+    """Max size of images to download before validating rows of a chunk."""
+
+    download_chunk_size = 1000
+    """Max number of objects to serialize at once when downloading."""
+
     def __init__(
         self,
         serializer_class: type[CsvModelSerializer],
         job: Optional[QueryCsvUploadJob] = None,
     ):
         self.serializer_class = serializer_class
-        self.serializer = serializer_class()
-        self.model_name = self.serializer.model_class.__name__
+
+        # Blank serializer is shared between services, fields are introspected once
+        self.serializer, self.flat_fields = get_flat_schema(serializer_class)
+        self.model_class = self.serializer.model_class
+        self.model_name = self.model_class.__name__
 
         self.fields: OrderedDict = self.serializer.get_fields()
         self.readonly_fields = self.serializer.readonly_fields
@@ -45,14 +92,12 @@ class QueryCsvService:
         self.required_fields = self.serializer.required_fields
         self.unique_fields = self.serializer.unique_fields
 
-        self.flat_fields = self.serializer.get_flat_fields()
-
         self.actions = [action.value for action in self.Actions]
         self.job = job
 
         # Calculate all available fields for forms
-        all_fields = list(self.serializer.get_fields().keys())
-        flat_fields = list(self.serializer.get_flat_fields().keys())
+        all_fields = list(self.fields.keys())
+        flat_fields = list(self.flat_fields.keys())
         self.available_fields = list(set(flat_fields + all_fields))
         self.available_fields.sort()
 
@@ -63,6 +108,7 @@ class QueryCsvService:
         assert job.serializer is not None, "Upload job must container serializer."
 
         # Start processing job
+        job.update_spreadsheet_info(commit=False)
         job.status = CsvUploadStatus.PROCESSING
         job.save()
 
@@ -71,9 +117,15 @@ class QueryCsvService:
 
         # Set final job status
         if not isinstance(failed, list):
-            # Break circuit if failed
+            # Break circuit if failed, chunks before the error are already
+            # saved and counted by the "processed" log
             job.status = CsvUploadStatus.FAILED
             job.error = failed
+            job.success_count = len(success)
+            job.add_log(
+                f"Upload failed, {len(success)} rows were saved before the error.",
+                commit=False,
+            )
             job.save()
 
             return success, failed
@@ -133,8 +185,13 @@ class QueryCsvService:
     def download_csv(self, queryset: models.QuerySet):
         """Download: Convert queryset to csv, return path to csv."""
 
-        data = self.serializer_class(queryset, many=True).data
-        flattened = [self.serializer_class.json_to_flat(obj) for obj in data]
+        # Serialize in chunks so only one batch of instances is held at a time
+        flattened = []
+        rows = queryset.iterator(chunk_size=self.download_chunk_size)
+
+        for chunk in batched(rows, self.download_chunk_size, strict=False):
+            data = self.serializer_class(chunk, many=True).data
+            flattened.extend(self.serializer_class.json_to_flat(obj) for obj in data)
 
         df = pd.json_normalize(flattened)
         buffer = BytesIO()
@@ -185,141 +242,744 @@ class QueryCsvService:
         """
         Upload: Given path to csv, create/update models and
         return successful and failed objects.
+
+        Each chunk is committed on its own. If a chunk raises, rows saved by
+        previous chunks are returned with the exception.
         """
+        success, errors = [], []
+
         try:
             if self.job:
                 self.job.start_clock()
 
-            # Start by importing csv
-            df = read_spreadsheet(file)
-            self._log_job_msg(
-                "Finished reading spreadsheet, processing field mappings..."
-            )
+            processed = 0
 
-            # Strip leading/trailing spaces from column names
-            df.columns = df.columns.str.strip()
+            # Import csv in chunks, each chunk is committed on its own
+            for df in iter_spreadsheet(file, chunksize=self.chunk_size):
+                self._log_job_msg(
+                    f"Read rows {processed + 1}-{processed + len(df)} of "
+                    "spreadsheet, processing field mappings..."
+                )
 
-            # Update df values with header associations
-            if custom_field_maps:
-                generic_list_keys = []  # Used for determining index when ambiguous
+                chunk_success, chunk_errors = self._upload_dataframe(
+                    df, custom_field_maps, start=processed
+                )
+                success.extend(chunk_success)
+                errors.extend(chunk_errors)
+                processed += len(df)
 
-                for mapping in custom_field_maps:
-                    map_field_name = mapping["field_name"].strip()
-                    column_name = mapping["column_name"].strip()
+            if self.job:
+                self.job.end_clock()
 
-                    if (
-                        map_field_name not in self.flat_fields.values()
-                        and map_field_name not in self.actions
-                    ):
-                        continue  # Safely skip invalid mappings
+            return success, errors
 
-                    elif map_field_name == self.Actions.SKIP.value:
-                        df.drop(columns=column_name, inplace=True)
+        except Exception as e:
+            print_error()
+            return success, e
 
-                        continue
+    def upload_dataframe(
+        self,
+        df: pd.DataFrame,
+        custom_field_maps: Optional[list[FieldMappingType]] = None,
+    ):
+        """
+        Upload: Like ``upload_csv``, but uses a dataframe that is already
+        loaded in memory instead of reading a file.
 
-                    field = self.serializer.get_flat_field(map_field_name)
+        The given dataframe is not modified.
+        """
+        try:
+            return self._upload_dataframe(df.copy(), custom_field_maps)
+        except Exception as e:
+            print_error()
+            return [], e
 
-                    if not field.is_list_item:
-                        # Default field logic
-                        df.rename(
-                            columns={column_name: map_field_name},
-                            inplace=True,
-                        )
-                        continue
-
-                    #######################################################
-                    # Handle list items.
-                    #
-                    # Mappings can come in as field[n].subfield, or field[0].subfield.
-                    # If the mapping uses n for the index, then the n will be the "nth" occurance
-                    # of that field, starting at 0.
-                    #
-                    # At this point, all "field" (FlatListField) values are index=None,
-                    # n-mappings will all be assigned indexes.
-                    #######################################################
-
-                    # Determine type
-                    numbers = re.findall(r"\d+", column_name)
-                    assert len(numbers) <= 1, (
-                        "List items can only contain 0 or 1 numbers (multi digit allowed)."
-                    )
+    def _upload_dataframe(
+        self,
+        df: pd.DataFrame,
+        custom_field_maps: Optional[list[FieldMappingType]] = None,
+        start: int = 0,
+    ):
+        """
+        Create/update models from dataframe, modifies dataframe in place.
 
-                    if len(numbers) == 1:
-                        # Number was provided in spreadsheet
-                        index = numbers[0]
-                    else:
-                        # Number was not provided in spreadsheet, get index of field
-                        index = len(
-                            [
-                                key
-                                for key in generic_list_keys
-                                if key == field.generic_key
-                            ]
-                        )
+        Set ``start`` to the number of rows already processed when uploading
+        a spreadsheet in chunks.
+        """
 
-                    field.set_index(index)
-                    generic_list_keys.append(field.generic_key)
+        # Strip leading/trailing spaces from column names
+        df.columns = df.columns.str.strip()
 
-                    df.rename(columns={column_name: str(field)}, inplace=True)
+        # Update df values with header associations, all columns are renamed at once
+        if custom_field_maps:
+            rename_map, skip_columns = self._get_column_mappings(custom_field_maps)
 
-            self._log_job_msg("Cleaning csv data and standardizing fields...")
+            df.drop(columns=skip_columns, inplace=True)
+            df.rename(columns=rename_map, inplace=True)
 
-            # Normalize & clean fields before conversion to dict
-            for field_name, field_type in self.serializer.get_flat_fields().items():
-                if field_name not in list(df.columns):
-                    continue
+        self._log_job_msg("Cleaning csv data and standardizing fields...")
 
-                if field_type.is_list_item:
-                    df[field_name] = df[field_name].map(
-                        lambda val: [
-                            (
-                                (item for item in str_to_list(val) if str(item) != "")
-                                if isinstance(val, str)
-                                else val
-                            )
-                        ]
-                    )
-                else:
-                    df[field_name] = df[field_name].map(
-                        lambda val: val if val != "" else None
-                    )
+        # Normalize & clean fields before conversion to dict
+        value_fields = set()
 
-            # Convert df to list of dicts, drop null fields
-            upload_data = df.to_dict("records")
-            filtered_data = [
-                {k: v for k, v in record.items() if v is not None}
-                for record in upload_data
-            ]
+        for field_name, field_type in self.flat_fields.items():
+            if field_name not in df.columns:
+                continue
+
+            if field_type.is_list_item:
+                df[field_name] = df[field_name].map(
+                    lambda val: [
+                        (
+                            (item for item in str_to_list(val) if str(item) != "")
+                            if isinstance(val, str)
+                            else val
+                        )
+                    ]
+                )
+                continue
+
+            value_fields.add(field_name)
+
+            # Strip spaces around text values, leaving other values as is
+            try:
+                stripped = df[field_name].str.strip()
+            except AttributeError:
+                continue  # Column does not contain text
+
+            df[field_name] = df[field_name].where(stripped.isna(), stripped)
+
+        # Convert df to list of dicts, drop null fields and empty values
+        columns = list(df.columns)
+        filtered_data = [
+            {
+                k: v
+                for k, v in zip(columns, row, strict=True)
+                if v is not None and not (k in value_fields and v == "")
+            }
+            for row in df.itertuples(index=False, name=None)
+        ]
+
+        # Finally, save data if valid
+        success = []
+        errors = []
+
+        self._log_job_msg("Unflattening csv data...")
+
+        # Look up existing objects for all rows at once
+        context = {
+            "prefetched_instances": self._prefetch_instances(filtered_data),
+            "related_instances": self._prefetch_related_instances(filtered_data),
+            "prefetched_images": self._prefetch_images(filtered_data),
+        }
+
+        # Note: string stripping is done in the serializer. Serializers are
+        # created as rows are processed instead of all at once.
+        serializers = (
+            self.serializer_class(data=data, flat=True, context=context)
+            for data in filtered_data
+        )
 
-            # Finally, save data if valid
-            success = []
-            errors = []
+        self._log_job_msg("Starting database update process...")
 
-            self._log_job_msg("Unflattening csv data...")
+        # Valid rows waiting to be saved in bulk, with unique values they use
+        pending_rows = []
+        pending_keys = set()
 
-            # Note: string stripping is done in the serializer
-            serializers = [
-                self.serializer_class(data=data, flat=True) for data in filtered_data
-            ]
+        def save_pending_rows():
+            rows_success, rows_errors = self._bulk_save(pending_rows)
+            success.extend(rows_success)
+            errors.extend(rows_errors)
+
+            pending_rows.clear()
+            pending_keys.clear()
 
-            self._log_job_msg("Starting database update process...")
+        # Roll back the chunk if the upload breaks partway through, since the
+        # caller only receives the exception in that case. Rows that fail to
+        # save are rolled back to their own savepoint and reported instead.
+        with transaction.atomic():
+            for serializer in serializers:
+                unique_keys = self._get_unique_keys(serializer.initial_data)
+
+                # Row could look up an object created/updated by a pending row
+                if not pending_keys.isdisjoint(unique_keys):
+                    save_pending_rows()
 
-            for i, serializer in enumerate(serializers):
                 if serializer.is_valid():
-                    serializer.save()
-                    success.append(serializer.data)
+                    try:
+                        instance = self._get_bulk_instance(serializer)
+                    except ValidationError as e:
+                        errors.append(self._get_error_report(serializer, e))
+                    else:
+                        if instance is not None:
+                            pending_rows.append((serializer, instance))
+                            pending_keys.update(unique_keys)
+                        else:
+                            # Keep rows in order, and visible to this row's save
+                            save_pending_rows()
+
+                            row_success, row_errors = self._save_row(serializer)
+                            success.extend(row_success)
+                            errors.extend(row_errors)
                 else:
                     report = {**serializer.data, "errors": {**serializer.errors}}
                     errors.append(report)
 
-                self._log_job_kwarg(key="processed", value=str(i + 1))
+                if len(pending_rows) >= self.batch_size:
+                    save_pending_rows()
 
-            if self.job:
-                self.job.end_clock()
+            save_pending_rows()
+
+        # Saved after the transaction so progress is not rolled back with rows
+        self._log_job_kwarg(key="processed", value=str(start + len(filtered_data)))
+
+        return success, errors
+
+    def _get_column_mappings(self, custom_field_maps: list[FieldMappingType]):
+        """
+        Get a dict of spreadsheet columns to rename to their field names,
+        and a list of columns to skip.
+        """
+
+        rename_map = {}
+        skip_columns = []
+        generic_list_keys = []  # Used for determining index when ambiguous
+
+        for mapping in custom_field_maps:
+            map_field_name = mapping["field_name"].strip()
+            column_name = mapping["column_name"].strip()
+
+            if (
+                map_field_name not in self.flat_fields.values()
+                and map_field_name not in self.actions
+            ):
+                continue  # Safely skip invalid mappings
+
+            elif map_field_name == self.Actions.SKIP.value:
+                skip_columns.append(column_name)
+
+                continue
+
+            field = self.serializer.get_flat_field(map_field_name)
+
+            if not field.is_list_item:
+                # Default field logic
+                rename_map[column_name] = map_field_name
+                continue
+
+            #######################################################
+            # Handle list items.
+            #
+            # Mappings can come in as field[n].subfield, or field[0].subfield.
+            # If the mapping uses n for the index, then the n will be the "nth" occurance
+            # of that field, starting at 0.
+            #
+            # At this point, all "field" (FlatListField) values are index=None,
+            # n-mappings will all be assigned indexes.
+            #######################################################
+
+            # Determine type
+            numbers = re.findall(r"\d+", column_name)
+            assert len(numbers) <= 1, (
+                "List items can only contain 0 or 1 numbers (multi digit allowed)."
+            )
+
+            if len(numbers) == 1:
+                # Number was provided in spreadsheet
+                index = numbers[0]
+            else:
+                # Number was not provided in spreadsheet, get index of field
+                index = len(
+                    [key for key in generic_list_keys if key == field.generic_key]
+                )
+
+            field.set_index(index)
+            generic_list_keys.append(field.generic_key)
+
+            rename_map[column_name] = str(field)
+
+        return rename_map, skip_columns
+
+    @cached_property
+    def bulk_fields(self) -> Optional[dict[str, models.Field]]:
+        """
+        Model fields that rows can set when saved in bulk.
+
+        Returns None if rows cannot be saved in bulk, which is the case
+        when the serializers, model, or manager add their own save logic,
+        or when save signals have receivers.
+        """
+
+        ModelClass = self.model_class
+        serializer_classes = [self.serializer_class]
+
+        for field in self.fields.values():
+            if isinstance(field, ListSerializer):
+                field = field.child
+
+            if isinstance(field, BaseSerializer):
+                serializer_classes.append(type(field))
+
+        def has_save_logic(serializer_class: type[BaseSerializer]):
+            base_class = next(
+                (
+                    base_class
+                    for base_class in (CsvModelSerializer, ModelSerializer, Serializer)
+                    if issubclass(serializer_class, base_class)
+                ),
+                BaseSerializer,
+            )
+
+            return (
+                serializer_class.save is not base_class.save
+                or serializer_class.create is not base_class.create
+                or serializer_class.update is not base_class.update
+            )
+
+        if not can_bulk_save(ModelClass) or any(
+            has_save_logic(serializer_class) for serializer_class in serializer_classes
+        ):
+            return None
+
+        return {
+            field.name: field
+            for field in ModelClass._meta.concrete_fields
+            if not field.primary_key and not isinstance(field, models.FileField)
+        }
+
+    @cached_property
+    def lookup_fields(self) -> set[str]:
+        """Fields the serializer can use to find an existing object for a row."""
+
+        fields = set(self.unique_fields)
+
+        for together_fields in self.serializer.unique_together_fields:
+            fields.update(together_fields)
+
+        return fields
+
+    def _prefetch_instances(self, records: list[dict]):
+        """
+        Get existing objects matching unique values in the records,
+        using one query per unique field.
+        """
+
+        prefetched = {}
+
+        for field in self.unique_fields:
+            values = {
+                str(record[field]).strip()
+                for record in records
+                if record.get(field, None) is not None
+            }
+            values.discard("")
+
+            if len(values) == 0:
+                continue
+
+            try:
+                objects = self.model_class._default_manager.in_bulk(
+                    values, field_name=field
+                )
+            except (TypeError, ValueError, ValidationError):
+                # Invalid values are handled when validating each row
+                continue
+
+            prefetched[field] = {str(key): obj for key, obj in objects.items()}
+
+        return prefetched
+
+    def _prefetch_related_instances(self, records: list[dict]):
+        """
+        Get existing related objects for slug values in the records, using
+        one query per writable slug field.
+        """
+
+        related_instances = {}
+
+        for field_name, field in self.fields.items():
+            if isinstance(field, ManyRelatedField):
+                field = field.child_relation
+
+            if (
+                not isinstance(field, WritableSlugRelatedField)
+                or field.extra_kwargs
+                or "__" in field.slug_field
+                or field.cache_key is None
+            ):
+                continue
+
+            values = set()
+
+            for record in records:
+                value = record.get(field_name, None)
+
+                if isinstance(value, str):
+                    value = str_to_list(value)
+                elif not isinstance(value, list):
+                    value = [value]
+
+                values.update(str(v) for v in value if v is not None and v != "")
+
+            if len(values) == 0:
+                continue
+
+            objects = {}
+            duplicates = set()
+
+            try:
+                queryset = field.get_queryset().filter(
+                    **{f"{field.slug_field}__in": values}
+                )
+
+                for obj in queryset:
+                    key = str(getattr(obj, field.slug_field))
+
+                    if key in objects:
+                        duplicates.add(key)
+
+                    objects[key] = obj
+            except (TypeError, ValueError, ValidationError):
+                continue
+
+            # Let the field raise for slugs matching multiple objects, as usual
+            for key in duplicates:
+                objects.pop(key)
+
+            related_instances.setdefault(field.cache_key, {}).update(objects)
+
+        return related_instances
+
+    def _prefetch_images(self, records: list[dict]):
+        """
+        Download images for image url values in the records, using
+        concurrent requests that share connections.
+
+        Maps each url to its response, or to the exception raised while
+        downloading it, so failed urls are not downloaded again. At most
+        ``image_prefetch_max_bytes`` of images are kept in memory, urls past
+        the limit are downloaded when their row is validated.
+        """
+
+        url_validator = URLValidator()
+        urls = {}  # Keeps row order, so earlier rows are prefetched first
+
+        for record in records:
+            for key, value in record.items():
+                field = self.flat_fields.get(key, None) or self.flat_fields.get(
+                    re.sub(FlatListField.list_pattern, "[n]", key), None
+                )
+
+                if field is None or not isinstance(field.field_instance, ImageUrlField):
+                    continue
+
+                try:
+                    url_validator(value)
+                except ValidationError:
+                    continue  # Invalid urls are reported when validating row
+
+                urls[value] = None
+
+        if len(urls) == 0:
+            return {}
+
+        workers = self.image_download_workers
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+
+        remaining_bytes = self.image_prefetch_max_bytes
+        lock = Lock()
+
+        with requests.Session() as session:
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+
+            def download(url: str):
+                nonlocal remaining_bytes
+
+                if remaining_bytes <= 0:
+                    return url, None
+
+                try:
+                    res = ImageUrlField.download(url, session=session, stream=True)
+                except requests.RequestException as e:
+                    return url, e
+
+                # Failed responses only need their status code
+                if not res.status_code < 300:
+                    res.close()
+                    return url, res
+
+                try:
+                    size = len(res.content)
+                except requests.RequestException as e:
+                    return url, e
+
+                with lock:
+                    if size > remaining_bytes:
+                        remaining_bytes = 0
+                        return url, None
+
+                    remaining_bytes -= size
+
+                return url, res
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                responses = list(executor.map(download, urls))
+
+        # Failed downloads are reported when validating row
+        return {url: res for url, res in responses if res is not None}
+
+    def _get_unique_keys(self, data: dict) -> set[tuple[str, str]]:
+        """Get unique field values a row can use to find an existing object."""
+
+        keys = set()
+
+        for field in self.lookup_fields:
+            value = data.get(field, None) if isinstance(data, dict) else None
+
+            if value is None or str(value).strip() == "":
+                continue
+
+            keys.add((field, str(value).strip()))
+
+        return keys
+
+    def _get_bulk_instance(self, serializer: CsvModelSerializer):
+        """
+        Get an unsaved instance with the serializer's validated data, or
+        None if the row needs to be saved with the serializer.
+
+        Mirrors the simple field handling in ``CsvModelSerializer.create``
+        and ``CsvModelSerializer.update``.
+        """
+
+        fields = self.bulk_fields
+
+        if fields is None:
+            return None
+
+        data = serializer.validated_data
+
+        for key, value in data.items():
+            if key not in fields or isinstance(value, (dict, list)):
+                return None
+
+        if serializer.instance is None:
+            # Create skips empty foreign keys
+            instance = self.model_class(
+                **{
+                    key: value
+                    for key, value in data.items()
+                    if value or not fields[key].is_relation
+                }
+            )
+        else:
+            instance = serializer.instance
+
+            for key, value in data.items():
+                setattr(instance, key, value)
+
+        # Same validation that runs in ``ModelBase.save``
+        instance.full_clean()
+
+        return instance
+
+    def _bulk_save(self, rows: list[tuple[CsvModelSerializer, models.Model]]):
+        """
+        Save rows with bulk queries, return their serialized data and
+        reports for rows that could not be saved.
+        """
+
+        if len(rows) == 0:
+            return [], []
+
+        ModelClass = self.model_class
+        manager = ModelClass._default_manager
+
+        created_rows = [row for row in rows if row[1]._state.adding]
+        created = [instance for _, instance in created_rows]
+        updated = [instance for _, instance in rows if not instance._state.adding]
+        update_fields = {
+            key
+            for serializer, instance in rows
+            if not instance._state.adding
+            for key in serializer.validated_data.keys()
+        }
+
+        try:
+            with transaction.atomic():
+                if (
+                    settings.POSTGRES_CSV_UPLOAD_COPY
+                    and connections[manager.db].vendor == "postgresql"
+                ):
+                    self._copy_create(created)
+                else:
+                    self._upsert_create(created_rows)
+
+                if len(updated) > 0:
+                    for field in self.bulk_fields.values():
+                        if getattr(field, "auto_now", False):
+                            for instance in updated:
+                                field.pre_save(instance, add=False)
+
+                            update_fields.add(field.name)
+
+                    manager.bulk_update(
+                        updated, list(update_fields), batch_size=self.batch_size
+                    )
+        except IntegrityError:
+            # Fall back to saving one at a time, to find which rows failed
+            success, errors = [], []
+
+            for serializer, _ in rows:
+                row_success, row_errors = self._save_row(serializer)
+                success.extend(row_success)
+                errors.extend(row_errors)
 
             return success, errors
 
-        except Exception as e:
-            print_error()
-            return [], e
+        for serializer, instance in rows:
+            serializer.instance = instance
+
+        # Copy to plain dicts, ``serializer.data`` keeps a reference to the
+        # serializer, which would keep every row's serializer in memory
+        return [dict(serializer.data) for serializer, _ in rows], []
+
+    @cached_property
+    def upsert_fields(self) -> list[str]:
+        """Unique fields that new objects can be upserted on."""
+
+        return [
+            field.name
+            for field in (self.bulk_fields or {}).values()
+            if field.unique and field.name in self.unique_fields
+        ]
+
+    def _upsert_create(self, rows: list[tuple[CsvModelSerializer, models.Model]]):
+        """
+        Create new objects with ``bulk_create``.
+
+        Rows that set a unique field use ``ON CONFLICT ... DO UPDATE``, so an
+        object created after the rows were looked up is updated, instead of
+        failing the whole batch. One query is used per unique field and set
+        of columns, since only the columns set by the rows are updated.
+        """
+
+        manager = self.model_class._default_manager
+        auto_now_fields = [
+            field.name
+            for field in self.bulk_fields.values()
+            if getattr(field, "auto_now", False)
+        ]
+
+        groups: dict[tuple, list[models.Model]] = {}
+
+        for serializer, instance in rows:
+            keys = serializer.validated_data.keys()
+            unique_field = next(
+                (
+                    field
+                    for field in self.upsert_fields
+                    if field in keys and getattr(instance, field) is not None
+                ),
+                None,
+            )
+            update_fields = tuple(sorted(keys - {unique_field})) if unique_field else ()
+
+            groups.setdefault((unique_field, update_fields), []).append(instance)
+
+        for (unique_field, update_fields), instances in groups.items():
+            if unique_field is None or len(update_fields) == 0:
+                # No unique value to conflict on, or no values to update
+                manager.bulk_create(instances, batch_size=self.batch_size)
+                continue
+
+            manager.bulk_create(
+                instances,
+                batch_size=self.batch_size,
+                update_conflicts=True,
+                unique_fields=[unique_field],
+                update_fields=[*update_fields, *auto_now_fields],
+            )
+
+    def _save_row(self, serializer: CsvModelSerializer):
+        """
+        Save a single row in its own savepoint, return its serialized data
+        or its error report.
+        """
+
+        try:
+            with transaction.atomic():
+                serializer.save()
+        except (DatabaseError, ValidationError) as e:
+            return [], [self._get_error_report(serializer, e)]
+
+        return [dict(serializer.data)], []
+
+    def _get_error_report(self, serializer: CsvModelSerializer, error: Exception):
+        """Report a row that passed validation, but could not be saved."""
+
+        if isinstance(error, ValidationError):
+            errors = (
+                error.message_dict
+                if hasattr(error, "error_dict")
+                else {"non_field_errors": error.messages}
+            )
+        else:
+            errors = {"non_field_errors": [str(error)]}
+
+        return {**serializer.initial_data, "errors": errors}
+
+    def _copy_create(self, instances: list[models.Model]):
+        """
+        Insert new objects using postgres COPY, like ``bulk_create``.
+
+        Primary keys are reserved from the table's sequence before copying,
+        so instances will have ids like they would after ``bulk_create``.
+        """
+
+        if len(instances) == 0:
+            return
+
+        ModelClass = self.model_class
+        meta = ModelClass._meta
+        db = ModelClass._default_manager.db
+        connection = connections[db]
+        quote = connection.ops.quote_name
+
+        pk_field = meta.pk
+        fields = meta.concrete_fields
+        columns = ", ".join(quote(field.column) for field in fields)
+
+        with connection.cursor() as cursor, connection.wrap_database_errors:
+            missing_pks = [
+                instance
+                for instance in instances
+                if getattr(instance, pk_field.attname) is None
+            ]
+
+            if isinstance(pk_field, AutoFieldMixin) and len(missing_pks) > 0:
+                cursor.execute(
+                    "SELECT nextval(pg_get_serial_sequence(%s, %s)) "
+                    "FROM generate_series(1, %s)",
+                    [meta.db_table, pk_field.column, len(missing_pks)],
+                )
+
+                for instance, (pk,) in zip(missing_pks, cursor.fetchall(), strict=True):
+                    setattr(instance, pk_field.attname, pk)
+
+            with cursor.copy(
+                f"COPY {quote(meta.db_table)} ({columns}) FROM STDIN"
+            ) as copy:
+                for instance in instances:
+                    copy.write_row(
+                        [
+                            field.get_db_prep_save(
+                                field.pre_save(instance, True), connection
+                            )
+                            for field in fields
+                        ]
+                    )
+
+        for instance in instances:
+            instance._state.adding = False
+            instance._state.db = db
@@ -69,13 +69,15 @@ def process_csv_job_task(job_id: int):
             to=[job.notify_email],
             body=mark_safe(
                 f"Your {model_name} csv did not upload successfully. Received the following error: "
-                f"{job.error or 'Unknown Error'}"
+                f"{job.error or 'Unknown Error'}. "
+                f"Objects saved before the error: {job.success_count or 0}."
             ),
         )
         mail.attach_alternative(
             (
                 f"Your {model_name} csv did not upload successfully. Received the following error:<br><br>"
-                f"{job.error or 'Unknown Error'}"
+                f"{job.error or 'Unknown Error'}<br><br>"
+                f"Objects saved before the error: {job.success_count or 0}"
             ),
             "text/html",
         )
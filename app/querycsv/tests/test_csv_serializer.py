@@ -1,3 +1,5 @@
+from core.mock.models import BusterTag
+
 from querycsv.tests.utils import CsvDataTestsBase
 
 
@@ -64,3 +66,26 @@ class CsvSerializerTests(CsvDataTestsBase):
 
         for expected_field in expected_fields:
             self.assertIn(expected_field, fields)
+
+    def test_get_or_create_nested(self):
+        """Should get existing nested objects and create missing ones."""
+
+        tag = BusterTag.objects.create(name="Existing")
+
+        tags = self.serializer._get_or_create_nested(
+            BusterTag, [{"name": "Existing"}, {"name": "New"}, {"name": "New"}]
+        )
+
+        self.assertEqual(tags[0], tag)
+        self.assertIsNotNone(tags[1].pk)
+        self.assertEqual(tags[1], tags[2])
+        self.assertEqual(BusterTag.objects.filter(name="New").count(), 1)
+
+    def test_get_or_create_nested_multiple_objects(self):
+        """Should raise error if nested values match more than one object."""
+
+        BusterTag.objects.create(name="Duplicate")
+        BusterTag.objects.create(name="Duplicate")
+
+        with self.assertRaises(BusterTag.MultipleObjectsReturned):
+            self.serializer._get_or_create_nested(BusterTag, [{"name": "Duplicate"}])
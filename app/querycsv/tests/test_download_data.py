@@ -2,7 +2,6 @@
 CSV Download Tests
 """
 
-from lib.faker import fake
 from utils.helpers import clean_list, str_to_list
 
 from querycsv.tests.utils import (
@@ -59,8 +58,9 @@ class DownloadCsvM2OFieldsTests(DownloadCsvTestsBase, CsvDataM2OTestsBase):
         self.assertCsvHasFields(df)
 
         # For each row, check the many-to-one field
-        for _index, row in df.iterrows():
-            obj_id = row["id"]
+        for obj_id, actual_value in zip(
+            df["id"], df[self.m2o_serializer_key], strict=True
+        ):
             expected_obj = self.repo.get_by_id(obj_id)
 
             expected_m2o_obj = getattr(expected_obj, self.m2o_model_key)
@@ -70,7 +70,6 @@ class DownloadCsvM2OFieldsTests(DownloadCsvTestsBase, CsvDataM2OTestsBase):
             else:
                 expected_value = getattr(expected_m2o_obj, self.m2o_model_foreign_key)
 
-            actual_value = row[self.m2o_serializer_key]
             if actual_value == "":
                 actual_value = None
 
@@ -95,8 +94,9 @@ class DownloadCsvM2MFieldsStrTests(DownloadCsvTestsBase, CsvDataM2MTestsBase):
         self.assertCsvHasFields(df)
 
         # For each row, check the many-to-one field
-        for _index, row in df.iterrows():
-            obj_id = row["id"]
+        for obj_id, actual_value_raw in zip(
+            df["id"], df[self.m2m_serializer_key], strict=True
+        ):
             expected_obj = self.repo.get_by_id(obj_id)
 
             expected_m2m_objs = getattr(expected_obj, self.m2m_model_selector)
@@ -107,7 +107,7 @@ class DownloadCsvM2MFieldsStrTests(DownloadCsvTestsBase, CsvDataM2MTestsBase):
                 ]
             )
 
-            actual_value_raw = str(row[self.m2m_serializer_key])
+            actual_value_raw = str(actual_value_raw)
             actual_values = clean_list(
                 [str(v).strip() for v in actual_value_raw.split(",")]
             )
@@ -123,7 +123,7 @@ class DownloadCsvM2MFieldsStrTests(DownloadCsvTestsBase, CsvDataM2MTestsBase):
             if i % 2 != 0:
                 continue
 
-            tag.name = tag.name + f", {fake.title()}"
+            tag.name = tag.name + f", {self.fake.title()}"
             tag.save()
 
         qs = self.repo.all()
@@ -133,8 +133,9 @@ class DownloadCsvM2MFieldsStrTests(DownloadCsvTestsBase, CsvDataM2MTestsBase):
 
         df = self.csv_to_df(file)
 
-        for _index, row in df.iterrows():
-            obj_id = row["id"]
+        for obj_id, actual_value_raw in zip(
+            df["id"], df[self.m2m_serializer_key], strict=True
+        ):
             expected_obj = self.repo.get_by_id(obj_id)
 
             expected_m2m_objs = getattr(expected_obj, self.m2m_model_selector)
@@ -145,7 +146,7 @@ class DownloadCsvM2MFieldsStrTests(DownloadCsvTestsBase, CsvDataM2MTestsBase):
                 ]
             )
 
-            actual_value_raw = str(row[self.m2m_serializer_key])
+            actual_value_raw = str(actual_value_raw)
             actual_values = str_to_list(actual_value_raw)
 
             self.assertListEqual(actual_values, expected_values)
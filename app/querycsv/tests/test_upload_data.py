@@ -6,16 +6,18 @@ import uuid
 from io import BytesIO
 from unittest.mock import patch
 
+import requests
 from core.mock.models import BusterTag
-from core.mock.serializers import BusterTagNestedSerializer
-from django.contrib.postgres.aggregates import StringAgg
+from core.mock.serializers import BusterCsvSerializer, BusterTagNestedSerializer
 from django.core import mail
+from django.core.exceptions import ValidationError
 from django.core.files import File
-from django.db import models
-from lib.faker import fake
+from django.test import override_settings
+from rest_framework.fields import empty
 from utils.testing import set_mock_return_image
 
 from querycsv.models import CsvUploadStatus, FieldMappingType, QueryCsvUploadJob
+from querycsv.serializers import WritableSlugRelatedField
 from querycsv.services import QueryCsvService
 from querycsv.tasks import process_csv_job_task
 from querycsv.tests.utils import (
@@ -25,6 +27,27 @@ from querycsv.tests.utils import (
 )
 
 
+class BusterEmptyQuerysetCsvSerializer(BusterCsvSerializer):
+    """Only sets tag queryset when data is given, like club memberships."""
+
+    many_tags_str = WritableSlugRelatedField(
+        slug_field="name",
+        source="many_tags",
+        queryset=BusterTag.objects.none(),
+        many=True,
+        required=False,
+        allow_null=True,
+    )
+
+    def __init__(self, instance=None, data=empty, **kwargs):
+        super().__init__(instance, data, **kwargs)
+
+        if data is not empty:
+            self.fields[
+                "many_tags_str"
+            ].child_relation.queryset = BusterTag.objects.all()
+
+
 class UploadCsvTests(UploadCsvTestsBase):
     """
     Test uploading data from a csv.
@@ -59,8 +82,7 @@ class UploadCsvTests(UploadCsvTestsBase):
         # Initialize data
         objects_before, file = self.initialize_csv_data(clear_db=False)
 
-        for obj in self.repo.all():
-            self.update_mock_object(obj)
+        self.update_mock_objects()
 
         # Call service upload function
         self.service.upload_csv(file=file)
@@ -75,11 +97,10 @@ class UploadCsvTests(UploadCsvTestsBase):
         # Initialize csv, add invalid column
         objects_before, _ = self.initialize_csv_data()
         self.df["Invalid field"] = "bad value"
-        file = self.df_to_csv(self.df)
 
-        self.assertTrue("Invalid field" in list(self.df.columns))
+        self.assertTrue("Invalid field" in self.df.columns)
 
-        self.service.upload_csv(file=file)
+        self.service.upload_dataframe(self.df)
 
         # Validate database
         self.assertObjectsExist(objects_before)
@@ -120,7 +141,6 @@ class UploadCsvTests(UploadCsvTestsBase):
             updated_records.append(payload)
 
         file = self.data_to_csv(updated_records)
-        self.assertObjectsExist(objects_before)
 
         # Upload CSV
         self.service.upload_csv(file=file)
@@ -128,14 +148,14 @@ class UploadCsvTests(UploadCsvTestsBase):
         # Validate data
         self.assertObjectsHaveFields(updated_records)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_upload_csv_create_images(self, mock_get):
         """Should download images from url when uploading csv to create objects."""
 
         set_mock_return_image(mock_get)
 
         payload = {
-            "name": fake.title(),
+            "name": self.fake.title(),
             "image": "https://example.com/image.png",
         }
 
@@ -148,14 +168,14 @@ class UploadCsvTests(UploadCsvTestsBase):
         self.assertEqual(obj.image.width, 300)
         self.assertEqual(obj.image.height, 300)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_upload_csv_update_images(self, mock_get):
         """Should download images from url when updating objects with csv."""
 
         set_mock_return_image(mock_get)
 
         default_payload = {
-            "name": fake.title(),
+            "name": self.fake.title(),
             "unique_name": uuid.uuid4(),
         }
 
@@ -175,11 +195,139 @@ class UploadCsvTests(UploadCsvTestsBase):
         self.assertEqual(obj.image.width, 300)
         self.assertEqual(obj.image.height, 300)
 
+    @patch("requests.get")
+    @patch("requests.Session.get")
+    def test_upload_csv_images_prefetch_limit(self, mock_session_get, mock_get):
+        """Images past the prefetch limit should be downloaded when validating row."""
+
+        set_mock_return_image(mock_get)
+
+        payload = {
+            "name": self.fake.title(),
+            "image": "https://example.com/image.png",
+        }
+
+        with patch.object(QueryCsvService, "image_prefetch_max_bytes", 0):
+            self.assertUploadPayload([payload])
+
+        mock_session_get.assert_not_called()
+        self.assertEqual(mock_get.call_count, 1)
+
+        obj = self.repo.first()
+        self.assertTrue(obj.image)
+
+    @patch("requests.get")
+    @patch("requests.Session.get")
+    def test_upload_csv_failed_images(self, mock_session_get, mock_get):
+        """Failed image downloads should not be downloaded again when validating."""
+
+        mock_session_get.side_effect = requests.ConnectionError()
+
+        payload = {
+            "name": self.fake.title(),
+            "image": "https://example.com/image.png",
+        }
+        file = self.data_to_csv([payload])
+
+        success, _ = self.service.upload_csv(file=file)
+        self.assertLength(success, 0)
+
+        self.assertEqual(mock_session_get.call_count, 1)
+        mock_get.assert_not_called()
+        self.assertEqual(self.repo.count(), 0)
+
+    def test_upload_csv_repeated_unique_fields(self):
+        """Rows sharing a unique field should update the object created by first row."""
+
+        unique_name = uuid.uuid4().__str__()
+        payload = [
+            {"name": self.fake.title(), "unique_name": unique_name},
+            {"name": self.fake.title(), "unique_name": unique_name},
+        ]
+
+        self.assertUploadPayload(payload)
+
+        self.assertEqual(self.repo.count(), 1)
+        obj = self.repo.first()
+
+        self.assertEqual(obj.name, payload[1]["name"])
+
+    def test_upload_csv_create_conflict(self):
+        """Should update an object created after the row was looked up."""
+
+        unique_name = uuid.uuid4().__str__()
+        payload = [{"name": self.fake.title(), "unique_name": unique_name}]
+        get_bulk_instance = self.service._get_bulk_instance
+
+        def create_conflict(serializer):
+            instance = get_bulk_instance(serializer)
+            self.repo.create(name=self.fake.title(), unique_name=unique_name)
+
+            return instance
+
+        with patch.object(
+            self.service, "_get_bulk_instance", side_effect=create_conflict
+        ):
+            self.assertUploadPayload(payload)
+
+        self.assertEqual(self.repo.count(), 1)
+        obj = self.repo.first()
+        self.assertEqual(obj.name, payload[0]["name"])
+
+    def test_upload_csv_batches(self):
+        """Should save all rows when upload is larger than the bulk batch size."""
+
+        self.service.batch_size = 2
+        payload = [{"name": self.fake.title()} for _ in range(5)]
+
+        success, _ = self.assertUploadPayload(payload)
+
+        self.assertEqual(self.repo.count(), 5)
+
+        # Results should not keep row serializers in memory
+        for record in success:
+            self.assertIs(type(record), dict)
+
+    def test_upload_csv_row_save_error(self):
+        """Should report a row that fails to save, and keep other rows."""
+
+        payload = [{"name": self.fake.title()} for _ in range(3)]
+        invalid_name = payload[1]["name"]
+
+        def full_clean(instance, *args, **kwargs):
+            if instance.name == invalid_name:
+                raise ValidationError({"name": "Invalid name."})
+
+        with patch.object(
+            self.model_class, "full_clean", autospec=True, side_effect=full_clean
+        ):
+            success, failed = self.assertUploadPayload(payload, validate_res=False)
+
+        self.assertLength(success, 2)
+        self.assertLength(failed, 1)
+        self.assertIn("name", failed[0]["errors"])
+        self.assertEqual(self.repo.count(), 2)
+        self.assertFalse(self.repo.filter(name=invalid_name).exists())
+
+    @override_settings(POSTGRES_CSV_UPLOAD_COPY=True)
+    def test_upload_csv_copy_create(self):
+        """Should create objects with COPY when enabled."""
+
+        payload = [{"name": self.fake.title()} for _ in range(3)]
+
+        success, _ = self.assertUploadPayload(payload)
+
+        self.assertEqual(self.repo.count(), 3)
+
+        for record in success:
+            obj = self.repo.get(id=record["id"])
+            self.assertIsNotNone(obj.created_at)
+
     def test_upload_csv_skip_fields(self):
         """Uploading a csv should allow option to skip fields."""
 
         payload = {
-            "name": fake.title(),
+            "name": self.fake.title(),
             "unique_name": uuid.uuid4().__str__(),
         }
         field_mappings = [{"column_name": "unique_name", "field_name": "SKIP"}]
@@ -196,21 +344,21 @@ class UploadCsvTests(UploadCsvTestsBase):
 
         payload = [
             {
-                "name": fake.title(),
+                "name": self.fake.title(),
                 "unique_name": uuid.uuid4().__str__(),
-                "unique_email": fake.safe_email(),
+                "unique_email": self.fake.safe_email(),
             },
             {
-                "name": fake.title(),
+                "name": self.fake.title(),
                 "unique_name": uuid.uuid4().__str__(),
-                "unique_email": fake.safe_email(),
+                "unique_email": self.fake.safe_email(),
             },
         ]
 
         # Situation 1: Missmatched unique fields, raise error
         # Example: unique_email matches, but unique_name does not
         self.repo.create(
-            name=fake.title(),
+            name=self.fake.title(),
             unique_name=uuid.uuid4(),
             unique_email=payload[0]["unique_email"],
         )
@@ -218,7 +366,7 @@ class UploadCsvTests(UploadCsvTestsBase):
         # Situation 2: Search one unique field, update the other
         # Examle: unique_name matches, but unique_email does not exist in the database
         self.repo.create(
-            name=fake.title(),
+            name=self.fake.title(),
             unique_name=payload[1]["unique_name"],
         )
 
@@ -232,15 +380,15 @@ class UploadCsvTests(UploadCsvTestsBase):
 
         payload = [
             {
-                "name": fake.title(),
-                "unique_email": fake.safe_email(),
+                "name": self.fake.title(),
+                "unique_email": self.fake.safe_email(),
             },
         ]
 
         # Situation 1: Optional unique field is null, create new object
         # Example: unique_name is null in db, and unique_name is provided in csv,
         # ignore the null value and continue creating new object
-        obj = self.repo.create(name=fake.title(), unique_email=None)
+        obj = self.repo.create(name=self.fake.title(), unique_email=None)
 
         self.assertUploadPayload(payload)
         self.assertEqual(self.repo.count(), 2)
@@ -270,7 +418,7 @@ class UploadJsonTests(UploadCsvTestsBase):
 
         payload = [
             {
-                "name": fake.title(),
+                "name": self.fake.title(),
                 "unique_name": uuid.uuid4().__str__(),
                 "many_tags_str": ["tag1", "tag2"],
             }
@@ -295,20 +443,20 @@ class UploadJsonTests(UploadCsvTestsBase):
 
         payload = [
             {
-                "name": fake.title(),
+                "name": self.fake.title(),
                 "unique_name": uuid.uuid4().__str__(),
                 "many_tags_nested": [
                     {
-                        "name": fake.title(),
-                        "color": fake.color(),
+                        "name": self.fake.title(),
+                        "color": self.fake.color(),
                     },
                     {
-                        "name": fake.title(),
-                        "color": fake.color(),
+                        "name": self.fake.title(),
+                        "color": self.fake.color(),
                     },
                     {
-                        "name": fake.title(),
-                        "color": fake.color(),
+                        "name": self.fake.title(),
+                        "color": self.fake.color(),
                     },
                 ],
             }
@@ -340,8 +488,7 @@ class UploadCsvJobTests(UploadCsvTestsBase):
         objects_before, file = self.initialize_csv_data(clear_db=False)
 
         # Update fields after create csv
-        for obj in self.repo.all():
-            self.update_mock_object(obj)
+        self.update_mock_objects()
 
         # Upload csv via service
         job = QueryCsvUploadJob.objects.create(
@@ -368,7 +515,6 @@ class UploadCsvJobTests(UploadCsvTestsBase):
             serializer_class=self.serializer_class, file=file
         )
         job.add_field_mapping(column_name="Test Value", field_name="name")
-        job.refresh_from_db()
 
         QueryCsvService.upload_from_job(job)
 
@@ -411,6 +557,60 @@ class UploadCsvJobTests(UploadCsvTestsBase):
         self.assertIsNotNone(job.error)
         self.assertFalse(job.report)
 
+    def test_partially_failed_job(self):
+        """Should report rows saved by chunks before a failed chunk."""
+
+        _, file = self.initialize_csv_data()
+
+        job = QueryCsvUploadJob.objects.create(
+            serializer_class=self.serializer_class, file=file
+        )
+        chunk_size = self.dataset_size // 2
+        upload_dataframe = QueryCsvService._upload_dataframe
+
+        def fail_second_chunk(svc, df, *args, start=0, **kwargs):
+            if start > 0:
+                raise Exception("Chunk failed")
+
+            return upload_dataframe(svc, df, *args, start=start, **kwargs)
+
+        with (
+            patch.object(QueryCsvService, "chunk_size", chunk_size),
+            patch.object(
+                QueryCsvService, "_upload_dataframe", autospec=True
+            ) as mock_upload_dataframe,
+        ):
+            mock_upload_dataframe.side_effect = fail_second_chunk
+            success, failed = self.assertUploadJob(job, validate_res=False)
+
+        job.refresh_from_db()
+
+        self.assertIsInstance(failed, Exception)
+        self.assertLength(success, chunk_size)
+        self.assertObjectsCount(chunk_size)
+        self.assertEqual(job.status, CsvUploadStatus.FAILED)
+        self.assertEqual(job.success_count, chunk_size)
+        self.assertEqual(job.logs["processed"], str(chunk_size))
+
+    def test_job_spreadsheet_info(self):
+        """Should save row count and headers, and not read the file again."""
+
+        _, file = self.initialize_csv_data()
+
+        job = QueryCsvUploadJob.objects.create(
+            serializer_class=self.serializer_class, file=file
+        )
+        self.assertIsNone(job.cached_spreadsheet_info)
+
+        job.update_spreadsheet_info()
+        job = QueryCsvUploadJob.objects.get(id=job.id)
+
+        with patch("querycsv.models.read_spreadsheet") as mock_read_spreadsheet:
+            self.assertEqual(job.row_count, len(self.df.index))
+            self.assertListEqual(job.csv_headers, list(self.df.columns))
+
+        mock_read_spreadsheet.assert_not_called()
+
 
 class UploadCsvM2OFieldsTests(UploadCsvTestsBase, CsvDataM2OTestsBase):
     """Test uploading csvs for models with many-to-one fields."""
@@ -431,7 +631,7 @@ class UploadCsvM2OFieldsTests(UploadCsvTestsBase, CsvDataM2OTestsBase):
 
         # Validate database
         self.assertObjectsHaveFields(objects_before)
-        self.assertIn(self.m2o_serializer_key, list(self.df.columns))
+        self.assertIn(self.m2o_serializer_key, self.df.columns)
 
         self.assertObjectsM2OValidFields(self.df)
 
@@ -442,15 +642,14 @@ class UploadCsvM2OFieldsTests(UploadCsvTestsBase, CsvDataM2OTestsBase):
         objects_before, file = self.initialize_csv_data(clear_db=False)
 
         # Update fields after create csv
-        for obj in self.repo.all():
-            self.update_mock_object(obj)
+        self.update_mock_objects()
 
         # Call upload function
         self.service.upload_csv(file=file)
 
         # Validate database
         self.assertObjectsHaveFields(objects_before)
-        self.assertIn(self.m2o_serializer_key, list(self.df.columns))
+        self.assertIn(self.m2o_serializer_key, self.df.columns)
 
         self.assertObjectsM2OValidFields(self.df)
 
@@ -471,8 +670,21 @@ class UploadCsvM2MFieldsTests(UploadCsvTestsBase, CsvDataM2MTestsBase):
 
         # Validate results
         self.assertObjectsHaveFields(objects_before)
-        self.assertIn(self.m2m_serializer_key, list(self.df.columns))
+        self.assertIn(self.m2m_serializer_key, self.df.columns)
+
+        self.assertObjectsM2MValidFields(self.df)
+
+    def test_upload_csv_m2m_fields_empty_queryset(self):
+        """When a slug field's queryset is empty until init, csv should upload."""
+
+        objects_before, file = self.initialize_csv_data()
 
+        service = QueryCsvService(serializer_class=BusterEmptyQuerysetCsvSerializer)
+        success, failed = service.upload_csv(file=file)
+        self.assertLength(success, self.dataset_size, failed)
+        self.assertLength(failed, 0)
+
+        self.assertObjectsHaveFields(objects_before)
         self.assertObjectsM2MValidFields(self.df)
 
     def test_upload_csv_m2m_fields_spaces(self):
@@ -480,12 +692,10 @@ class UploadCsvM2MFieldsTests(UploadCsvTestsBase, CsvDataM2MTestsBase):
 
         objects_before, _ = self.initialize_csv_data()
 
-        # Iterate through csv, manually add spacing
-        for _i, row in self.df.iterrows():
-            pre_value = row[self.m2m_serializer_key]
-            pre_values = pre_value.split(",")
-            modified_value = "  ,  ".join(pre_values)
-            row[self.m2m_serializer_key] = modified_value
+        # Manually add spacing around each comma in the csv
+        self.df[self.m2m_serializer_key] = self.df[self.m2m_serializer_key].str.replace(
+            ",", "  ,  ", regex=False
+        )
 
         file = self.df_to_csv(self.df)
 
@@ -496,7 +706,7 @@ class UploadCsvM2MFieldsTests(UploadCsvTestsBase, CsvDataM2MTestsBase):
 
         # Validate results
         self.assertObjectsHaveFields(objects_before)
-        self.assertIn(self.m2m_serializer_key, list(self.df.columns))
+        self.assertIn(self.m2m_serializer_key, self.df.columns)
 
         self.assertObjectsM2MValidFields(self.df)
 
@@ -509,18 +719,7 @@ class UploadCsvM2MFieldsTests(UploadCsvTestsBase, CsvDataM2MTestsBase):
         # Update fields after create csv
         self.update_dataset()
 
-        objects_before = list(
-            self.repo.all()
-            .annotate(
-                pre_objs_count=models.Count(self.m2m_model_key),
-                pre_objs=StringAgg(
-                    models.F(f"{self.m2m_model_key}__{self.m2m_model_foreign_key}"),
-                    distinct=True,
-                    delimiter=",",
-                ),
-            )
-            .values()
-        )
+        m2m_before = self.get_m2m_values_by_object()
 
         # Upload csv using service
         success, failed = self.service.upload_csv(file=file)
@@ -528,24 +727,20 @@ class UploadCsvM2MFieldsTests(UploadCsvTestsBase, CsvDataM2MTestsBase):
         self.assertLength(failed, 0)
 
         # Validate results
-        self.assertEqual(self.repo.all().count(), self.dataset_size)
-        expected_objects = list(self.df.to_dict("records"))
-
-        self.assertObjectsHaveFields(expected_objects)
-        self.assertIn(self.m2m_serializer_key, list(self.df.columns))
-        self.assertTrue(
-            self.m2m_repo.all().count() <= self.m2m_size + self.m2m_update_size,
-            f"Expected at most {self.m2m_size + self.m2m_update_size} M2M objects, "
-            f"but {self.m2m_repo.all().count()} were created.",
+        self.assertObjectsCounts(
+            self.dataset_size, m2m_max_count=self.m2m_size + self.m2m_update_size
         )
 
-        self.assertObjectsM2MValidFields(self.df, objects_before)
+        self.assertObjectsHaveFields(self.df)
+        self.assertIn(self.m2m_serializer_key, self.df.columns)
+
+        self.assertObjectsM2MValidFields(self.df, m2m_before)
 
     def test_upload_csv_m2m_fields_commas(self):
         """Uploading a M2M object with a comma should work if wrapped in quotes."""
 
         payload = {
-            "name": fake.title(),
+            "name": self.fake.title(),
             "many_tags_str": 'one,two,"three, four, five"',
         }
         self.assertUploadPayload([payload])
@@ -578,8 +773,8 @@ class UploadCsvNestedFieldsTests(UploadCsvTestsBase):
         """Uploading a csv with a nested single field should work."""
 
         payload = {
-            "name": fake.title(),
-            "one_tag_nested.name": fake.title(),
+            "name": self.fake.title(),
+            "one_tag_nested.name": self.fake.title(),
         }
         self.assertUploadPayload([payload])
 
@@ -596,14 +791,14 @@ class UploadCsvNestedFieldsTests(UploadCsvTestsBase):
 
         default_payload = {
             "unique_name": uuid.uuid4(),
-            "name": fake.title(),
+            "name": self.fake.title(),
         }
 
         self.repo.create(**default_payload)
 
         payload = {
             **default_payload,
-            "one_tag_nested.name": fake.title(),
+            "one_tag_nested.name": self.fake.title(),
         }
         self.assertUploadPayload([payload])
 
@@ -619,11 +814,11 @@ class UploadCsvNestedFieldsTests(UploadCsvTestsBase):
         """Uploading a csv with nested many fields should work."""
 
         payload = {
-            "name": fake.title(),
-            "many_tags_nested[0].name": fake.title(),
-            "many_tags_nested[0].color": fake.color(),
-            "many_tags_nested[1].name": fake.title(),
-            "many_tags_nested[1].color": fake.color(),
+            "name": self.fake.title(),
+            "many_tags_nested[0].name": self.fake.title(),
+            "many_tags_nested[0].color": self.fake.color(),
+            "many_tags_nested[1].name": self.fake.title(),
+            "many_tags_nested[1].color": self.fake.color(),
         }
         self.assertUploadPayload([payload])
 
@@ -643,22 +838,53 @@ class UploadCsvNestedFieldsTests(UploadCsvTestsBase):
         nested_obj = nested_obj.first()
         self.assertEqual(nested_obj.color, payload["many_tags_nested[1].color"])
 
+    def test_upload_csv_reuse_many_nested(self):
+        """Nested objects with the same values should only be created once."""
+
+        tag = {"name": self.fake.title(), "color": self.fake.color()}
+        existing_tag = self.nested_repo.create(**tag)
+        new_tag_name = self.fake.title()
+
+        payload = [
+            {
+                "name": self.fake.title(),
+                "many_tags_nested[0].name": tag["name"],
+                "many_tags_nested[0].color": tag["color"],
+                "many_tags_nested[1].name": new_tag_name,
+                "many_tags_nested[2].name": new_tag_name,
+            },
+            {
+                "name": self.fake.title(),
+                "many_tags_nested[0].name": new_tag_name,
+            },
+        ]
+        self.assertUploadPayload(payload)
+
+        self.assertEqual(self.repo.count(), 2)
+        self.assertEqual(self.nested_repo.count(), 2)
+
+        new_tag = self.nested_repo.get(name=new_tag_name)
+        for obj in self.repo.all():
+            self.assertIn(new_tag, obj.many_tags.all())
+
+        self.assertEqual(existing_tag.busters.count(), 1)
+
     def test_upload_csv_update_many_nested(self):
         """Uploading a csv with nested many fields should update the object."""
 
         default_payload = {
             "unique_name": uuid.uuid4(),
-            "name": fake.title(),
+            "name": self.fake.title(),
         }
 
         self.repo.create(**default_payload)
 
         payload = {
             **default_payload,
-            "many_tags_nested[0].name": fake.title(),
-            "many_tags_nested[0].color": fake.color(),
-            "many_tags_nested[1].name": fake.title(),
-            "many_tags_nested[1].color": fake.color(),
+            "many_tags_nested[0].name": self.fake.title(),
+            "many_tags_nested[0].color": self.fake.color(),
+            "many_tags_nested[1].name": self.fake.title(),
+            "many_tags_nested[1].color": self.fake.color(),
         }
         self.assertUploadPayload([payload])
 
@@ -682,9 +908,9 @@ class UploadCsvNestedFieldsTests(UploadCsvTestsBase):
         """Should upload csv payload with mapping."""
 
         payload = {
-            "buster": fake.title(),
-            "tag_name": fake.title(),
-            "tag_color": fake.color(),
+            "buster": self.fake.title(),
+            "tag_name": self.fake.title(),
+            "tag_color": self.fake.color(),
         }
         mappings: list[FieldMappingType] = [
             {"column_name": "buster", "field_name": "name"},
@@ -708,9 +934,9 @@ class UploadCsvNestedFieldsTests(UploadCsvTestsBase):
     #     """Should upload csv payload including an "n-field"."""
 
     #     payload = {
-    #         "name": fake.title(),
-    #         "many_tags_nested[n].name": fake.title(),
-    #         "many_tags_nested[n].color": fake.color(),
+    #         "name": self.fake.title(),
+    #         "many_tags_nested[n].name": self.fake.title(),
+    #         "many_tags_nested[n].color": self.fake.color(),
     #     }
 
     #     self.assertUploadPayload([payload])
@@ -2,8 +2,10 @@
 CSV Data Tests Utilities
 """
 
+import csv
 import json
 import random
+from collections import defaultdict
 from io import BytesIO, StringIO
 from typing import Optional
 
@@ -14,7 +16,7 @@ from core.mock.serializers import BusterCsvSerializer
 from django.core.files import File
 from django.core.files.storage import default_storage
 from django.db import models
-from lib.faker import fake
+from lib.faker import CustomFaker
 from lib.spreadsheets import read_spreadsheet
 from utils.files import get_unique_filename
 from utils.helpers import clean_list
@@ -23,6 +25,15 @@ from querycsv.models import CsvUploadStatus, FieldMappingType, QueryCsvUploadJob
 from querycsv.services import QueryCsvService
 
 
+def iter_records(df: pd.DataFrame):
+    """Iterate over rows in dataframe as dicts, one row at a time."""
+
+    columns = list(df.columns)
+
+    for values in df.itertuples(index=False, name=None):
+        yield dict(zip(columns, values, strict=True))
+
+
 class CsvDataTestsBase(TestsBase):
     """
     Base tests for Csv data services.
@@ -53,6 +64,16 @@ class CsvDataTestsBase(TestsBase):
     unique_field = "unique_name"
     """The field to test updates against."""
 
+    fake_seed = 0
+    """Seed for the faker instance shared by tests in the class."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.fake = CustomFaker("en_US")
+        cls.fake.seed_instance(cls.fake_seed)
+
     def setUp(self) -> None:
         self.repo = self.model_class.objects
         self.serializer = self.serializer_class()
@@ -63,10 +84,10 @@ class CsvDataTestsBase(TestsBase):
     # Overrides
     #####################
     def get_create_params(self, **kwargs):
-        return {"name": fake.title(), **kwargs}
+        return {"name": self.fake.title(), **kwargs}
 
     def get_update_params(self, obj: model_class, **kwargs):
-        return {"name": fake.title(), **kwargs}
+        return {"name": self.fake.title(), **kwargs}
 
     # Initialization
     #####################
@@ -107,6 +128,26 @@ class CsvDataTestsBase(TestsBase):
 
         return obj
 
+    def update_mock_objects(self, objects: Optional[list[model_class]] = None):
+        """Update all objects to differ from csv, save in one query."""
+
+        if objects is None:
+            objects = list(self.repo.all())
+
+        update_fields = set()
+
+        for obj in objects:
+            params = self.get_update_params(obj=obj)
+            update_fields.update(params.keys())
+
+            for key, value in params.items():
+                setattr(obj, key, value)
+
+        if objects and update_fields:
+            self.repo.bulk_update(objects, list(update_fields))
+
+        return objects
+
     def get_unique_filename(self, ext="csv"):
         """Get unique file name for a file used in these tests."""
 
@@ -131,11 +172,24 @@ class CsvDataTestsBase(TestsBase):
         data_copy = [self.serializer.json_to_flat(obj) for obj in data]
         return pd.DataFrame.from_records(data_copy)
 
-    def data_to_csv(self, data: list[dict]):
+    def data_to_csv(self, data: list[dict], file_prefix: str = "test-csv"):
         """Convert list of dicts to a csv, return file."""
 
-        df = self.data_to_df(data)
-        return self.df_to_csv(df)
+        records = [self.serializer.json_to_flat(obj) for obj in data]
+        fieldnames = list(dict.fromkeys(key for record in records for key in record))
+
+        # Write rows directly, creating a dataframe is not needed here
+        text_buffer = StringIO()
+        writer = csv.DictWriter(text_buffer, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(records)
+
+        filename = get_unique_filename(file_prefix, ext="csv")
+
+        buffer = BytesIO(text_buffer.getvalue().encode())
+        default_storage.save(filename, content=buffer)
+
+        return File(buffer, filename)
 
     def csv_to_df(self, file: File):
         """Convert csv at path to list of objects."""
@@ -197,7 +251,7 @@ class CsvDataM2OTestsBase(CsvDataTestsBase):
         self.m2o_repo = self.m2o_model_class.objects
 
     def get_m2o_create_params(self, **kwargs):
-        return {"name": fake.title()}
+        return {"name": self.fake.title()}
 
     def create_mock_m2o_object(self, **kwargs):
         """Create Many to One object for testing."""
@@ -236,7 +290,7 @@ class CsvDataM2OTestsBase(CsvDataTestsBase):
         """Compare actual objects in the database with expected values in csv."""
 
         # Compare csv value with actual value
-        for _index, row in df.iterrows():
+        for row in iter_records(df):
             # Raw values in csv
             expected_value = row[self.m2o_serializer_key]
 
@@ -244,11 +298,10 @@ class CsvDataM2OTestsBase(CsvDataTestsBase):
                 continue
 
             self.assertIsInstance(expected_value, str)
-            query = row.to_dict()
             obj = self.repo.get(
                 **{
                     k: v
-                    for k, v in query.items()
+                    for k, v in row.items()
                     if k != self.m2o_serializer_key
                     and k not in self.serializer.readonly_fields
                     and k not in self.serializer.any_related_fields
@@ -316,7 +369,7 @@ class CsvDataM2MTestsBase(CsvDataTestsBase):
             self.m2m_model_selector = self.m2m_serializer_key
 
     def get_m2m_create_params(self, **kwargs):
-        return {"name": fake.title(), **kwargs}
+        return {"name": self.fake.title(), **kwargs}
 
     def initialize_dataset(self):
         super().initialize_dataset()
@@ -325,16 +378,24 @@ class CsvDataM2MTestsBase(CsvDataTestsBase):
         for _i in range(self.m2m_size):
             m2m_objects.append(self.create_mock_m2m_object())
 
-        for obj in self.repo.all():
-            m2m_repo = getattr(obj, self.m2m_model_selector)
+        # Assign m2m objects by creating all through rows at once
+        field = self.model_class._meta.get_field(self.m2m_model_selector)
+        through = field.remote_field.through
+        source_key = field.m2m_field_name()
+        target_key = field.m2m_reverse_field_name()
+
+        through_objects = []
 
+        for obj_id in self.repo.values_list("id", flat=True):
             assignment_count = random.randint(0, self.m2m_assignment_max)
             selected_m2m_objects = random.sample(m2m_objects, assignment_count)
 
-            for _i, m2m_obj in enumerate(selected_m2m_objects):
-                m2m_repo.add(m2m_obj)
+            for m2m_obj in selected_m2m_objects:
+                through_objects.append(
+                    through(**{f"{source_key}_id": obj_id, target_key: m2m_obj})
+                )
 
-            obj.save()
+        through.objects.bulk_create(through_objects)
 
     def update_dataset(self):
         return super().update_dataset()
@@ -344,13 +405,61 @@ class CsvDataM2MTestsBase(CsvDataTestsBase):
             **self.get_m2m_create_params(**kwargs)
         )
 
+    def get_m2m_values_by_object(self) -> dict[int, list]:
+        """Map each object's id to its m2m objects' foreign key values."""
+
+        field = self.model_class._meta.get_field(self.m2m_model_key)
+        through = field.remote_field.through
+        source_key = field.m2m_field_name()
+        target_key = field.m2m_reverse_field_name()
+
+        values = defaultdict(list)
+
+        for obj_id, value in through.objects.values_list(
+            f"{source_key}_id", f"{target_key}__{self.m2m_model_foreign_key}"
+        ):
+            values[obj_id].append(value)
+
+        return values
+
+    def get_objects_counts(self) -> tuple[int, int]:
+        """Count objects and m2m objects in the database with one query."""
+
+        # Plain COUNT() calls, so the query is not grouped by each object
+        m2m_count = self.m2m_repo.order_by().values(
+            count=models.Func(models.F("pk"), function="COUNT")
+        )
+        counts = (
+            self.repo.order_by()
+            .values(
+                count=models.Func(models.F("pk"), function="COUNT"),
+                m2m_count=models.Subquery(m2m_count),
+            )
+            .get()
+        )
+
+        return counts["count"], counts["m2m_count"]
+
+    def assertObjectsCounts(self, count: int, m2m_max_count: int):
+        """Objects count should match, m2m objects count should not exceed max."""
+
+        actual_count, actual_m2m_count = self.get_objects_counts()
+
+        self.assertEqual(actual_count, count)
+        self.assertLessEqual(
+            actual_m2m_count,
+            m2m_max_count,
+            f"Expected at most {m2m_max_count} M2M objects, "
+            f"but {actual_m2m_count} were created.",
+        )
+
     def assertObjectsM2MValidFields(
-        self, df: pd.DataFrame, objects_before: list[dict] = None
+        self, df: pd.DataFrame, m2m_before: Optional[dict[int, list]] = None
     ):
         """Compare expected objects in the csv with actual objects from database."""
 
         # Compare csv value with actual value
-        for _index, row in df.iterrows():
+        for row in iter_records(df):
             # Raw value in csv
             expected_value = row[self.m2m_serializer_key]
 
@@ -358,10 +467,9 @@ class CsvDataM2MTestsBase(CsvDataTestsBase):
                 continue
 
             # self.assertIsInstance(expected_value, str)
-            csv_values = row.to_dict()
             query = None
 
-            for key, value in csv_values.items():
+            for key, value in row.items():
                 # Skip fields if they represent object, are none, or are for the serializer only
                 if (
                     key in self.serializer.many_related_fields
@@ -430,9 +538,7 @@ class DownloadCsvTestsBase(CsvDataTestsBase):
     def assertCsvHasFields(self, df: pd.DataFrame):
         """Iterate over csv data and verify with DB."""
 
-        records = df.to_dict("records")
-
-        for record in records:
+        for record in iter_records(df):
             id = record.get("id")
             actual_object = self.repo.get_by_id(id)
 
@@ -583,14 +689,27 @@ class UploadCsvTestsBase(CsvDataTestsBase):
             query = self.repo.filter(**expected_obj)
             self.assertTrue(query.exists(), msg=msg)
 
-    def assertObjectsHaveFields(self, expected_objects: list[dict]):
+    def assertObjectsHaveFields(self, expected_objects: list[dict] | pd.DataFrame):
         """
         Check if the actual object has expected fields.
 
         Verify by comparing the serialized representation for before and after
         the upload - both should have the save value for writable fields.
+
+        Expected objects can be a list of dicts, or a dataframe with a row
+        for each object.
         """
 
+        if isinstance(expected_objects, pd.DataFrame):
+            expected_objects = iter_records(expected_objects)
+
+        writable_fields = self.serializer.writable_fields
+        query_fields = (
+            set(writable_fields)
+            .difference(self.serializer.any_related_fields)
+            .intersection(self.model_class.get_fields_list())
+        )
+
         for expected_obj in expected_objects:
             expected_serializer = self.serializer_class(data=expected_obj)
             self.assertValidSerializer(expected_serializer)
@@ -599,11 +718,7 @@ class UploadCsvTestsBase(CsvDataTestsBase):
             query = {
                 k: v
                 for k, v in expected_obj.items()
-                if k in self.serializer.writable_fields
-                and k not in self.serializer.any_related_fields
-                and k in self.model_class.get_fields_list()
-                and v is not None
-                and v != ""
+                if k in query_fields and v is not None and v != ""
             }
 
             # Extra parsing for query
@@ -615,15 +730,16 @@ class UploadCsvTestsBase(CsvDataTestsBase):
             actual_object = self.repo.get(**query)
             actual_serializer = self.serializer_class(actual_object)
 
-            for field in self.serializer.writable_fields:
-                if (
-                    field not in expected_serializer.data.keys()
-                    and field not in actual_serializer.data.keys()
-                ):
+            # Serialize each representation once, data returns a new copy on access
+            expected_data = expected_serializer.data
+            actual_data = actual_serializer.data
+
+            for field in writable_fields:
+                if field not in expected_data and field not in actual_data:
                     continue
 
-                expected_value = expected_serializer.data[field]
-                actual_value = actual_serializer.data[field]
+                expected_value = expected_data[field]
+                actual_value = actual_data[field]
 
                 if isinstance(expected_value, str):
                     expected_value.strip()
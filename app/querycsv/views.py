@@ -1,6 +1,5 @@
 import logging
 import re
-from time import sleep
 
 from core.abstracts.serializers import ModelSerializerBase
 from django.http import HttpRequest
@@ -63,16 +62,6 @@ class QueryCsvViewSet:
                         file=request.FILES["file"],
                     )
 
-                    for i in range(5):
-                        try:
-                            assert len(job.spreadsheet.columns) >= 0
-                            break
-                        except Exception as e:
-                            if i == 4:
-                                raise e
-                            sleep(3)
-                            continue
-
                     return redirect(self.get_reverse("upload_headermapping"), id=job.id)
             except Exception as e:
                 print_error()
@@ -92,6 +81,9 @@ class QueryCsvViewSet:
         job = get_object_or_404(QueryCsvUploadJob, id=id)
         # TODO: What to do if job is completed, or url is visited for a previous job
 
+        # Read headers once, the upload task reuses them
+        job.update_spreadsheet_info()
+
         context = {
             **(extra_context or {}),
             "upload_job": job,
@@ -103,19 +95,15 @@ class QueryCsvViewSet:
 
             if formset.is_valid():
                 custom_mappings = [
-                    mapping
+                    {
+                        "column_name": mapping["csv_header"],
+                        "field_name": mapping["object_field"],
+                    }
                     for mapping in formset.cleaned_data
                     if mapping["csv_header"] != mapping["object_field"]
                 ]
 
-                for mapping in custom_mappings:
-                    job.add_field_mapping(
-                        column_name=mapping["csv_header"],
-                        field_name=mapping["object_field"],
-                        commit=False,
-                    )
-
-                job.save()
+                job.add_field_mappings(custom_mappings)
 
                 send_process_csv_job_signal(job)
                 self.message_user(request, "Successfully uploaded csv.", logging.INFO)
@@ -3,36 +3,40 @@ Users admin config.
 """
 
 from clubs.models import ClubMembership
-from core.abstracts.admin import ModelAdminBase, StackedInlineBase
+from core.abstracts.admin import ModelAdminBase, StackedInlineBase, TabularInlineBase
 from django import forms
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.forms import UserChangeForm, UserCreationForm
+from django.contrib.auth.models import Permission
 from django.db import models
 from django.http import HttpRequest
 from django.utils.safestring import mark_safe
 from utils.formatting import plural_noun, plural_noun_display
-from utils.permissions import parse_permissions
 
-from users.defaults import DEFAULT_USER_PERMISSIONS
 from users.models import Profile, SocialProfile, User, VerifiedEmail
 from users.serializers import UserCsvSerializer
 from users.services import UserService
 
 
-class UserProfileInline(admin.StackedInline):
+class UserProfileInline(StackedInlineBase):
     """User profile inline."""
 
     model = Profile
+    extra = 1
     can_delete = False
+    select_related_fields = ("user",)
     verbose_name_plural = "profile"
 
 
-class UserClubMembershipInline(StackedInlineBase):
+class UserClubMembershipInline(TabularInlineBase):
     """Manage user memberships to a club in admin."""
 
     model = ClubMembership
     extra = 0
+    autocomplete_fields = ("club",)
+    select_related_fields = ("club", "user")
+    prefetch_related_fields = ("roles",)
     readonly_fields = (
         "roles",
         "edit_roles",
@@ -72,9 +76,10 @@ class CreateUserForm(UserCreationForm):
             raise forms.ValidationError("Fill out both fields")
         return password2
 
-    def save(self, commit=True):
-        user = super().save(commit=False)
-        pwd = self.cleaned_data.get("password1")
+    def set_password_and_save(self, user, password_field_name="password1", commit=True):
+        """Called by ``UserCreationForm.save``, hashes the password once."""
+
+        pwd = self.cleaned_data.get(password_field_name)
         if pwd:
             user.set_password(pwd)
         else:
@@ -89,11 +94,33 @@ class CreateUserForm(UserCreationForm):
         fields = UserCreationForm.Meta.fields + ("email",)
 
 
-class SocialProfileInline(admin.StackedInline):
+class SocialProfileInline(TabularInlineBase):
     """Manage user's social profiles in admin."""
 
     model = SocialProfile
     extra = 1
+    select_related_fields = ("user",)
+
+
+class PermissionAdmin(admin.ModelAdmin):
+    """Search permissions for user permission autocomplete."""
+
+    list_display = ("name", "codename", "content_type")
+    list_select_related = ("content_type",)
+    search_fields = ("name", "codename", "content_type__app_label")
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("content_type")
+
+    # Permissions are managed by migrations, admin is read only
+    def has_add_permission(self, request, *args, **kwargs):
+        return False
+
+    def has_change_permission(self, request, *args, **kwargs):
+        return False
+
+    def has_delete_permission(self, request, *args, **kwargs):
+        return False
 
 
 class UserAdmin(BaseUserAdmin, ModelAdminBase):
@@ -105,6 +132,7 @@ class UserAdmin(BaseUserAdmin, ModelAdminBase):
 
     list_display = ("username", "email", "name", "is_staff")
     search_fields = ("username", "email", "profile__school_email")
+    list_select_related = ("profile",)
     select_related_fields = ("profile",)
     prefetch_related_fields = (
         "club_memberships",
@@ -156,9 +184,14 @@ class UserAdmin(BaseUserAdmin, ModelAdminBase):
         ),
     )
 
+    # Load permission and group options on demand instead of rendering every row
+    autocomplete_fields = ("groups", "user_permissions")
+
     inlines = (UserProfileInline, SocialProfileInline, UserClubMembershipInline)
 
     def profile_image(self, obj):
+        if not getattr(obj, "profile", None):
+            return None
         return self.as_image(obj.profile.image)
 
     def is_school_email_verified(self, obj):
@@ -175,28 +208,23 @@ class UserAdmin(BaseUserAdmin, ModelAdminBase):
     @admin.action
     def sync_permissions(self, request, queryset):
         """Sync permissions for selected users."""
-        perms = parse_permissions(DEFAULT_USER_PERMISSIONS)
-
-        for user in queryset:
-            for perm in perms:
-                if not user.user_permissions.filter(id=perm.id).exists():
-                    user.user_permissions.add(perm)
+        user_ids = list(queryset.values_list("id", flat=True))
+        UserService.sync_default_permissions(user_ids)
 
         self.message_user(
             request,
-            f"Successfully synced permissions for {plural_noun_display(queryset.count(), 'user')}",
+            f"Successfully synced permissions for {plural_noun_display(len(user_ids), 'user')}",
         )
 
     @admin.action
     def send_account_setup_link(self, request, queryset):
         """Send password reset for each selected user."""
 
-        for user in queryset:
-            UserService(user).send_account_setup_link()
+        sent_count = UserService.send_account_setup_links(queryset)
 
         self.message_user(
             request,
-            f"Successfully sent setup link to {queryset.count()} {plural_noun(queryset.count(), 'user')}",
+            f"Successfully sent setup link to {sent_count} {plural_noun(sent_count, 'user')}",
         )
 
         return
@@ -205,14 +233,16 @@ class UserAdmin(BaseUserAdmin, ModelAdminBase):
     def send_admin_setup_link(self, request, queryset):
         """Send link to setup admin account."""
 
-        queryset.update(is_staff=True)
+        # Only rewrite rows that change, all selected users still get an email
+        queryset.filter(is_staff=False).update(is_staff=True)
 
-        for user in queryset:
-            UserService(user).send_account_setup_link(send_to_client=False)
+        sent_count = UserService.send_account_setup_links(
+            queryset, send_to_client=False
+        )
 
         self.message_user(
             request,
-            f"Successfully sent admin setup link to {queryset.count()} {plural_noun(queryset.count(), 'user')}",
+            f"Successfully sent admin setup link to {sent_count} {plural_noun(sent_count, 'user')}",
         )
 
         return
@@ -221,15 +251,18 @@ class UserAdmin(BaseUserAdmin, ModelAdminBase):
     def merge_users(self, request, queryset):
         """Merge multiple user accounts."""
 
+        # Count before merging, merged users are deleted from the queryset
+        user_count = queryset.count()
         user = UserService.merge_users(users=queryset)
 
         self.message_user(
             request,
-            f"Successfully merged {plural_noun_display(queryset.count(), 'user')} to {user} (id={user.id})",
+            f"Successfully merged {plural_noun_display(user_count, 'user')} to {user} (id={user.id})",
         )
 
         return
 
 
 admin.site.register(User, UserAdmin)
+admin.site.register(Permission, PermissionAdmin)
 admin.site.register(VerifiedEmail)
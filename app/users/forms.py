@@ -15,13 +15,13 @@ class AuthForm(forms.Form):
     event = forms.ModelChoiceField(
         label="event",
         widget=forms.HiddenInput(),
-        queryset=Event.objects.all(),
+        queryset=Event.objects.only("pk"),
         required=False,
     )
     club = forms.ModelChoiceField(
         label="club",
         widget=forms.HiddenInput(),
-        queryset=Club.objects.all(),
+        queryset=Club.objects.only("pk"),
         required=False,
     )
 
@@ -1,8 +1,7 @@
 # Generated by Django 5.2.8 on 2026-02-21 18:04
 
-import uuid
-
-from django.db import migrations
+from django.db import migrations, models
+from django.db.models import Func
 
 
 def migrate_populate_user_calendar_token(apps, schema_editor):
@@ -10,18 +9,16 @@ def migrate_populate_user_calendar_token(apps, schema_editor):
     
     User = apps.get_model('users', 'User')
     
-    for user in User.objects.all():
-        user.calendar_token = uuid.uuid4()
-        user.save()
+    # Postgres 13+ generates random uuids natively, backfill in one UPDATE
+    User.objects.filter(calendar_token__isnull=True).update(
+        calendar_token=Func(function='gen_random_uuid', output_field=models.UUIDField())
+    )
     
 def migrate_reverse_populate_user_calendar_token(apps, schema_editor):
     """Clear out all calendar tokens."""
     
     User = apps.get_model('users', 'User')
-    
-    for user in User.objects.all():
-        user.calendar_token = None
-        user.save()
+    User.objects.update(calendar_token=None)
 
 
 class Migration(migrations.Migration):
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-17 12:00
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0044_alter_user_calendar_token"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                django.db.models.functions.text.Upper("username"),
+                name="user_username_upper_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                django.db.models.functions.text.Upper("email"),
+                name="user_email_upper_idx",
+            ),
+        ),
+    ]
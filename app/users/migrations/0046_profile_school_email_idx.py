@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-17 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0045_user_user_username_upper_idx_user_email_upper_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="profile",
+            index=models.Index(
+                condition=models.Q(("school_email__isnull", False)),
+                fields=["school_email"],
+                name="school_email_idx",
+            ),
+        ),
+    ]
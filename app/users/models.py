@@ -11,7 +11,6 @@ from typing import ClassVar, Optional
 
 from core.abstracts.models import ManagerBase, ModelBase, SocialProfileBase, UniqueModel
 from core.abstracts.schedules import schedule_clocked_func
-from django.contrib import auth
 from django.contrib.auth.models import (
     AbstractBaseUser,
     BaseUserManager,
@@ -20,7 +19,8 @@ from django.contrib.auth.models import (
 from django.core import exceptions
 from django.core.exceptions import PermissionDenied
 from django.core.validators import RegexValidator, validate_email
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Upper
 from django.utils import timezone
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
@@ -29,6 +29,7 @@ from lib.countries import CountryField
 from utils.models import UploadFilepathFactory
 
 from app import settings
+from users.utils import get_global_perm_backends
 
 # class UserType(enum):
 #     """The type of user object."""
@@ -65,46 +66,39 @@ class UserManager(BaseUserManager, ManagerBase["User"]):
             user.set_unusable_password()
             user.is_active = False
 
-        user.save(using=self._db)
+        # Commit user and profile together
+        with transaction.atomic(using=self._db):
+            user.save(using=self._db)
 
-        Profile.objects.create(
-            user=user,
-            name=name,
-            phone=phone,
-        )
-        user.save(using=self._db)  # Set default profile image, etc
+            Profile.objects.create(
+                user=user,
+                name=name,
+                phone=phone,
+            )
 
         return user
 
     def create_superuser(self, email, password, **extra_fields):
         """Create and return a new superuser."""
-        user = self.create_user(email, password, **extra_fields)
-        user.is_staff = True
-        user.is_superuser = True
-        user.save(using=self._db)
+        extra_fields.setdefault("is_staff", True)
+        extra_fields.setdefault("is_superuser", True)
 
-        return user
+        return self.create_user(email, password, **extra_fields)
 
     def create_adminuser(self, email, password, **extra_fields):
         """Create and return a new admin user."""
-        user = self.create_user(email, password, **extra_fields)
-        user.is_staff = True
-        user.is_superuser = False
-        user.save(using=self._db)
+        extra_fields.setdefault("is_staff", True)
+        extra_fields.setdefault("is_superuser", False)
 
-        return user
+        return self.create_user(email, password, **extra_fields)
 
     def get_or_create(self, defaults=None, **kwargs):
         """Return user if they exist, or create a new one if not."""
 
-        query = self.filter(**kwargs)
-        if query.exists() and query.count() == 1:
-            return query.first(), False
-        elif query.count() > 1:
-            raise User.MultipleObjectsReturned(
-                f"Expected 1 user, but returned {query.count()}!"
-            )
-        else:
+        try:
+            # Raises MultipleObjectsReturned if more than one user matches
+            return self.get(**kwargs), False
+        except self.model.DoesNotExist:
             defaults = defaults or {}
             return self.create(**defaults, **kwargs), True
 
@@ -120,10 +114,13 @@ class UserManager(BaseUserManager, ManagerBase["User"]):
     def get_by_email(self, email: str):
         """Get user by their email."""
 
-        return User.objects.get(
-            models.Q(email=email) | models.Q(profile__school_email=email)
+        # Resolve school emails first so both conditions can use an index
+        school_email_user_ids = list(
+            Profile.objects.filter(school_email=email).values_list("user_id", flat=True)
         )
 
+        return self.get(models.Q(email=email) | models.Q(pk__in=school_email_user_ids))
+
 
 class User(AbstractBaseUser, PermissionsMixin, UniqueModel):
     """User model for system."""
@@ -170,12 +167,12 @@ class User(AbstractBaseUser, PermissionsMixin, UniqueModel):
 
     @property
     def is_email_verified(self):
-        return self.verified_emails.filter(email=self.email).exists()
+        return self.has_verified_email(self.email)
 
     @property
     def can_authenticate(self) -> bool:
         """See if this user has a way to authenticate with the server."""
-        return self.has_usable_password() or self.socialaccount_set.count() > 0
+        return self.has_usable_password() or self.socialaccount_set.exists()
 
     @property
     def is_useragent(self):
@@ -184,7 +181,7 @@ class User(AbstractBaseUser, PermissionsMixin, UniqueModel):
     @property
     def is_onboarded(self) -> bool:
         return (
-            self.club_memberships.count() > 0
+            self.club_memberships.exists()
             and self.profile is not None
             and self.profile.name is not None
         )
@@ -192,14 +189,37 @@ class User(AbstractBaseUser, PermissionsMixin, UniqueModel):
     @property
     def is_club_admin(self) -> bool:
         """User is an admin at least one club."""
-        for membership in self.club_memberships.all():
-            if membership.is_admin:
-                return True
+        memberships = self.club_memberships.all()
+
+        # Admin is derived from role permissions, load them with the memberships
+        if "club_memberships" not in getattr(self, "_prefetched_objects_cache", {}):
+            memberships = memberships.prefetch_related(
+                "roles__permissions__content_type"
+            )
+
+        return any(membership.is_admin for membership in memberships)
+
+    def has_verified_email(self, email: Optional[str]) -> bool:
+        """Check email against prefetched verified emails, or query for it."""
+        if not email:
+            return False
+
+        if "verified_emails" in getattr(self, "_prefetched_objects_cache", {}):
+            return any(ve.email == email for ve in self.verified_emails.all())
+
+        return self.verified_emails.filter(email=email).exists()
 
     # Overrides
     def __str__(self):
         return self.username
 
+    class Meta:
+        # Allauth looks up users with iexact, which compiles to UPPER() on postgres
+        indexes = [
+            models.Index(Upper("username"), name="user_username_upper_idx"),
+            models.Index(Upper("email"), name="user_email_upper_idx"),
+        ]
+
     def clean(self):
         # If user is created through some other method, ensure username is set.
         if self.username is None or self.username == "":
@@ -215,9 +235,7 @@ class User(AbstractBaseUser, PermissionsMixin, UniqueModel):
         # Adapted from:
         # https://github.com/django/django/blob/485f483d49144a2ea5401442bc3b937a370b3ca6/django/contrib/auth/models.py#L261
         if is_global:
-            for backend in auth.get_backends():
-                if not hasattr(backend, "has_global_perm"):
-                    continue
+            for backend in get_global_perm_backends():
                 try:
                     if backend.has_global_perm(self, perm):
                         return True
@@ -242,17 +260,9 @@ class User(AbstractBaseUser, PermissionsMixin, UniqueModel):
         ):
             raise exceptions.ValidationError({"email": "Email is already in use"})
 
-        # Check email unique among verified emails
+        # Check email and username unique among verified emails
         if (
-            VerifiedEmail.objects.filter(email=self.email)
-            .exclude(user__id=self.id)
-            .exists()
-        ):
-            raise exceptions.ValidationError({"email": "Email is already in use"})
-
-        # Check username unique among verified emails
-        if (
-            VerifiedEmail.objects.filter(email=self.username)
+            VerifiedEmail.objects.filter(email__in={self.email, self.username})
             .exclude(user__id=self.id)
             .exists()
         ):
@@ -344,9 +354,7 @@ class Profile(ModelBase):
 
     @cached_property
     def is_school_email_verified(self):
-        return any(
-            ve.email == self.school_email for ve in self.user.verified_emails.all()
-        )
+        return self.user.has_verified_email(self.school_email)
 
     def __str__(self):
         return self.name or self.user.username
@@ -370,27 +378,27 @@ class Profile(ModelBase):
         indexes = [
             models.Index(
                 fields=("phone",), name="phone_idx", condition=_is_unique_nonempty_phone
-            )
+            ),
+            # User email validation checks school emails on every save
+            models.Index(
+                fields=("school_email",),
+                name="school_email_idx",
+                condition=models.Q(school_email__isnull=False),
+            ),
         ]
 
     def clean(self):
-        if not getattr(self, "user_id", None):
-            return
+        if not getattr(self, "user_id", None) or not self.school_email:
+            return super().clean()
+
         # Check school email unique among verified emails
         if (
             VerifiedEmail.objects.filter(email=self.school_email)
-            .exclude(user=self.user)
+            .exclude(user_id=self.user_id)
             .exists()
         ):
             raise exceptions.ValidationError("School email is already in use")
 
-        # Check school email unique among user emails
-        if (
-            VerifiedEmail.objects.filter(email=self.school_email)
-            .exclude(user=self.user)
-            .exists()
-        ):
-            raise exceptions.ValidationError("School email is already in use")
         return super().clean()
 
 
@@ -438,16 +446,30 @@ class UserAgent(User):
         return True
 
 
+VERIFICATION_CODE_CHARACTERS = string.ascii_uppercase + string.digits
+
+_verification_code_random = random.SystemRandom()
+
+
 def generate_verification_code():
     """Get a unique verification code."""
-    characters = string.ascii_uppercase + string.digits
 
-    # Keep regenerating code until unique
+    # Check a batch of candidates per query, keep regenerating until one is unique
     while True:
-        code = "".join(random.choices(characters, k=6))
+        codes = {
+            "".join(
+                _verification_code_random.choices(VERIFICATION_CODE_CHARACTERS, k=6)
+            )
+            for _ in range(8)
+        }
+        codes -= set(
+            EmailVerificationCode.objects.filter(code__in=codes).values_list(
+                "code", flat=True
+            )
+        )
 
-        if not EmailVerificationCode.objects.filter(code=code).exists():
-            return code
+        if codes:
+            return codes.pop()
 
 
 def generate_verification_expiry():
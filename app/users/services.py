@@ -9,20 +9,20 @@ from django.contrib.auth.tokens import default_token_generator
 from django.core.exceptions import BadRequest, ValidationError
 from django.core.mail import send_mail
 from django.core.validators import validate_email
-from django.db import models, transaction
+from django.db import connection, models, transaction
 from django.forms import model_to_dict
 from django.http import HttpRequest
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.utils.encoding import force_bytes
 from django.utils.http import urlencode, urlsafe_base64_decode, urlsafe_base64_encode
-from lib.emails import send_html_mail
+from lib.emails import build_html_mail, send_html_mail, send_mass_html_mail
 from polls.models import PollSubmission
 from rest_framework.authtoken.models import Token
 from utils.helpers import get_client_url, get_full_url
 
 from users.models import EmailVerificationCode, User, VerifiedEmail
-from users.utils import is_school_email
+from users.utils import get_default_user_permission_ids, is_school_email
 
 
 class UserService(ServiceBase[User]):
@@ -73,13 +73,15 @@ class UserService(ServiceBase[User]):
             ids = [user.id for user in users]
             users = User.objects.filter(id__in=ids)
 
-        users = users.order_by("id")
+        users = users.select_related("profile").prefetch_related(None).order_by("id")
         oldest_user = users.first()
-        other_users = users.exclude(id=oldest_user.id)
+        other_users = list(users.exclude(id=oldest_user.id))
 
-        if not other_users.exists():
+        if len(other_users) == 0:
             return oldest_user
 
+        other_ids = [user.id for user in other_users]
+
         # If there's any issues, revert everything
         with transaction.atomic():
             # Merge info from other users
@@ -100,24 +102,39 @@ class UserService(ServiceBase[User]):
                 ):
                     oldest_user.email = user.email
 
-                # Merge relationships
-                Token.objects.filter(user=user).delete()
-                VerifiedEmail.objects.filter(user=user).update(user=oldest_user)
-                PollSubmission.objects.filter(user=user).update(user=oldest_user)
-                SocialAccount.objects.filter(user=user).update(user=oldest_user)
-
-                # Merge memberships
-                oldest_user_clubs = oldest_user.clubs.values_list("id", flat=True)
-                oldest_user_teams = oldest_user.teams.values_list("id", flat=True)
-                ClubMembership.objects.filter(user=user).exclude(
-                    club__id__in=oldest_user_clubs
-                ).update(user=oldest_user)
-                TeamMembership.objects.filter(user=user).exclude(
-                    team__id__in=oldest_user_teams
-                ).update(user=oldest_user)
+            # Merge relationships, one query per table for all users
+            Token.objects.filter(user_id__in=other_ids).delete()
+            VerifiedEmail.objects.filter(user_id__in=other_ids).update(user=oldest_user)
+            PollSubmission.objects.filter(user_id__in=other_ids).update(
+                user=oldest_user
+            )
+            SocialAccount.objects.filter(user_id__in=other_ids).update(user=oldest_user)
+
+            # Merge memberships, keeping the first membership for each club/team
+            for MembershipModel, group_field in (
+                (ClubMembership, "club_id"),
+                (TeamMembership, "team_id"),
+            ):
+                existing_groups = MembershipModel.objects.filter(
+                    user=oldest_user
+                ).values(group_field)
+                memberships = (
+                    MembershipModel.objects.filter(user_id__in=other_ids)
+                    .exclude(**{f"{group_field}__in": existing_groups})
+                    .order_by("user_id", "id")
+                    .values_list("id", group_field)
+                )
+
+                membership_ids = {}
+                for membership_id, group_id in memberships:
+                    membership_ids.setdefault(group_id, membership_id)
+
+                MembershipModel.objects.filter(id__in=membership_ids.values()).update(
+                    user=oldest_user
+                )
 
             # Delete other users
-            other_users.delete()
+            User.objects.filter(id__in=other_ids).delete()
 
             # Save user info
             oldest_user.profile.save()
@@ -125,6 +142,29 @@ class UserService(ServiceBase[User]):
 
         return oldest_user
 
+    @classmethod
+    def sync_default_permissions(cls, user_ids: list[int]):
+        """Add missing default permissions to users in a single query."""
+
+        UserPermission = User.user_permissions.through
+        quote = connection.ops.quote_name
+        table = quote(UserPermission._meta.db_table)
+        user_col = quote(UserPermission._meta.get_field("user").column)
+        perm_col = quote(UserPermission._meta.get_field("permission").column)
+
+        # Existing pairs are skipped by the table's unique constraint
+        query = (
+            f"INSERT INTO {table} ({user_col}, {perm_col}) "
+            "SELECT u.id, p.id FROM unnest(%s::bigint[]) AS u(id) "
+            "CROSS JOIN unnest(%s::bigint[]) AS p(id) "
+            "ON CONFLICT DO NOTHING"
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                query, [list(user_ids), list(get_default_user_permission_ids())]
+            )
+
     def login(self, request):
         """Creates a new user session."""
 
@@ -160,6 +200,35 @@ class UserService(ServiceBase[User]):
     ):
         """Send link to user for setting up account."""
 
+        self.get_account_setup_link_mail(
+            next_url=next_url, send_to_client=send_to_client
+        ).send()
+
+    @classmethod
+    def send_account_setup_links(
+        cls, users: models.QuerySet[User] | list[User], send_to_client=True
+    ):
+        """Send account setup links to multiple users, return number sent."""
+
+        if isinstance(users, models.QuerySet):
+            # Emails only use user fields, skip relations prefetched by callers
+            users = users.select_related(None).prefetch_related(None)
+
+        messages = [
+            cls(user).get_account_setup_link_mail(send_to_client=send_to_client)
+            for user in users
+        ]
+
+        if len(messages) == 0:
+            return 0
+
+        return send_mass_html_mail(messages)
+
+    def get_account_setup_link_mail(
+        self, next_url: Optional[str] = None, send_to_client=True
+    ):
+        """Create email containing link to user for setting up account."""
+
         uidb64 = urlsafe_base64_encode(force_bytes(self.obj.pk))
         code = default_token_generator.make_token(self.obj)
 
@@ -180,7 +249,7 @@ class UserService(ServiceBase[User]):
         if next_url:
             url += "?" + urlencode({"next": next_url})
 
-        send_html_mail(
+        return build_html_mail(
             "Finish account setup",
             to=[self.obj.email],
             html_template="users/account-setup-link.html",
@@ -1,11 +1,12 @@
 from app.settings import SCHOOL_EMAIL_DOMAIN
-from django.db.models.signals import post_save
+from django.contrib.auth.models import Permission
+from django.core.signals import setting_changed
+from django.db.models.signals import post_delete, post_migrate, post_save
 from django.dispatch import receiver
 from utils.images import create_default_icon
-from utils.permissions import parse_permissions
 
-from users.defaults import DEFAULT_USER_PERMISSIONS
 from users.models import Profile, User
+from users.utils import get_default_user_permission_ids, get_global_perm_backends
 
 # @receiver(pre_save, sender=User)
 # def pre_save_user(sender, instance: User, created=False, **kwargs):
@@ -30,7 +31,7 @@ def on_save_user(sender, instance: User, created=False, **kwargs):
 
     # Set default permissions for all users
     if instance.user_permissions.all().count() == 0:
-        instance.user_permissions.set(parse_permissions(DEFAULT_USER_PERMISSIONS))
+        instance.user_permissions.set(get_default_user_permission_ids())
 
     # Skip if being created
     if created:
@@ -40,25 +41,61 @@ def on_save_user(sender, instance: User, created=False, **kwargs):
         Profile.objects.create(user=instance)
         instance.refresh_from_db()
 
-    if instance.profile.school_email is None and instance.email.endswith(
-        SCHOOL_EMAIL_DOMAIN
+    set_profile_defaults(instance.profile)
+
+
+@receiver(post_save, sender=Profile)
+def on_save_profile(sender, instance: Profile, created=False, **kwargs):
+    """Runs when profile object is saved."""
+
+    # Set defaults for new profiles without waiting for the user to be saved again
+    if created:
+        set_profile_defaults(instance)
+
+
+def set_profile_defaults(profile: Profile):
+    """Set school email and default profile image if missing."""
+
+    user = profile.user
+    changed = False
+
+    if (
+        profile.school_email is None
+        and user.email
+        and user.email.endswith(SCHOOL_EMAIL_DOMAIN)
     ):
-        instance.profile.school_email = instance.email
-        instance.profile.save()
+        profile.school_email = user.email
+        changed = True
 
-    # Skip if has image
-    if instance.profile.image:
-        return
+    if not profile.image:
+        initials = ""
+        if profile.name is not None and len(profile.name) > 0:
+            initials = "".join([word[0] for word in profile.name.split(" ", 3)])
+        elif user.email:
+            initials = user.email[0]
+        else:
+            initials = user.username[:1]
+
+        profile.image = create_default_icon(
+            initials, image_path="users/images/generated/", fileprefix=user.pk
+        )
+        changed = True
+
+    if changed:
+        profile.save()
+
+
+@receiver(post_migrate)
+@receiver(post_delete, sender=Permission)
+def on_permissions_changed(sender, **kwargs):
+    """Runs after migrations or deleting a permission, ids may have changed."""
+
+    get_default_user_permission_ids.cache_clear()
 
-    initials = ""
-    if instance.profile.name is not None and len(instance.profile.name) > 0:
-        initials = "".join([word[0] for word in instance.profile.name.split(" ", 3)])
-    else:
-        initials = instance.email[0]
 
-    file = create_default_icon(
-        initials, image_path="users/images/generated/", fileprefix=instance.pk
-    )
+@receiver(setting_changed)
+def on_setting_changed(sender, setting, **kwargs):
+    """Runs when a setting is overridden, like in tests."""
 
-    instance.profile.image = file
-    instance.profile.save()
+    if setting == "AUTHENTICATION_BACKENDS":
+        get_global_perm_backends.cache_clear()
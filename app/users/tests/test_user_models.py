@@ -1,7 +1,7 @@
 from core.abstracts.tests import TestsBase
 from django.core import exceptions
 
-from users.models import VerifiedEmail
+from users.models import Profile, VerifiedEmail
 from users.tests.utils import create_test_user
 
 
@@ -70,3 +70,17 @@ class UserEmailEdgeCaseTests(TestsBase):
         with self.assertRaises(exceptions.ValidationError):
             u1.email = "user@ufl.edu"
             u1.save()
+
+    def test_user_without_email_profile_defaults(self):
+        """Should set profile defaults for users without an email."""
+
+        user = create_test_user(username="noemail")
+        Profile.objects.filter(user=user).delete()
+
+        # Saving user recreates the missing profile
+        user.email = None
+        user.save()
+
+        profile = Profile.objects.get(user=user)
+        self.assertIsNone(profile.school_email)
+        self.assertTrue(profile.image)
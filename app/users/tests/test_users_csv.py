@@ -124,7 +124,7 @@ class UserCsvTests(UploadCsvTestsBase):
         self.assertEqual(ClubRole.objects.count(), roles_before)
         self.assertEqual(SocialProfile.objects.count(), 2)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_upload_user_profile_image(self, mock_get):
         """When uploading user csv, should upload profile images."""
 
@@ -145,7 +145,7 @@ class UserCsvTests(UploadCsvTestsBase):
         self.assertEqual(user.profile.image.width, 300)
         self.assertEqual(user.profile.image.height, 300)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_upload_user_profile_update_image(self, mock_get):
         """When uploading user csv, should update user profile image."""
 
@@ -1,12 +1,15 @@
 from clubs.tests.utils import create_test_club
 from core.abstracts.tests import TestsBase
+from django.contrib.auth.models import Permission
+from django.core import mail
 from events.tests.utils import create_test_event
 from polls.tests.utils import create_test_poll, create_test_pollsubmission
 from rest_framework.authtoken.models import Token
 
 from users.models import User
 from users.services import UserService
-from users.tests.utils import create_test_user
+from users.tests.utils import create_test_user, create_test_users
+from users.utils import get_default_user_permission_ids
 
 
 class UserServiceTests(TestsBase):
@@ -93,3 +96,79 @@ class UserServiceTests(TestsBase):
         self.assertEqual(s4.user.id, user.id)
         self.assertEqual(s5.user.id, user.id)
         self.assertEqual(s6.user.id, user.id)
+
+    def test_send_account_setup_links(self):
+        """Should send one account setup email to each user."""
+
+        users = create_test_users(3)
+
+        sent_count = UserService.send_account_setup_links(users)
+
+        self.assertEqual(sent_count, 3)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertListEqual(
+            [email.to[0] for email in mail.outbox],
+            [user.email for user in users],
+            sort_lists=True,
+        )
+
+    def test_sync_default_permissions(self):
+        """Should add missing default permissions to each user."""
+
+        users = create_test_users(3)
+        perm_ids = get_default_user_permission_ids()
+
+        users[0].user_permissions.clear()
+        users[1].user_permissions.remove(perm_ids[0])
+
+        UserService.sync_default_permissions([user.id for user in users])
+
+        for user in users:
+            self.assertListEqual(
+                list(user.user_permissions.values_list("id", flat=True)),
+                list(perm_ids),
+                sort_lists=True,
+            )
+
+    def test_sync_default_permissions_one_query(self):
+        """Should add missing permissions for all users with one query."""
+
+        users = create_test_users(3)
+        perm_ids = get_default_user_permission_ids()
+
+        for user in users:
+            user.user_permissions.clear()
+
+        with self.assertNumQueries(1):
+            UserService.sync_default_permissions([user.id for user in users])
+
+        for user in users:
+            self.assertListEqual(
+                list(user.user_permissions.values_list("id", flat=True)),
+                list(perm_ids),
+                sort_lists=True,
+            )
+
+    def test_sync_default_permissions_recreated(self):
+        """Should use new ids if default permissions are recreated."""
+
+        user = create_test_user()
+        old_perm_ids = get_default_user_permission_ids()
+
+        # Recreate permission with a new id, like after flushing the database
+        perm = Permission.objects.get(id=old_perm_ids[0])
+        perm.delete()
+        perm.id = None
+        perm.save()
+
+        perm_ids = get_default_user_permission_ids()
+        self.assertIn(perm.id, perm_ids)
+        self.assertNotIn(old_perm_ids[0], perm_ids)
+
+        UserService.sync_default_permissions([user.id])
+
+        self.assertListEqual(
+            list(user.user_permissions.values_list("id", flat=True)),
+            list(perm_ids),
+            sort_lists=True,
+        )
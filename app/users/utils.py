@@ -1,6 +1,12 @@
+from functools import cache
+
 from app.settings import SCHOOL_EMAIL_DOMAIN
+from django.contrib import auth
 from django.core import exceptions
 from django.core.validators import validate_email
+from utils.permissions import parse_permissions
+
+from users.defaults import DEFAULT_USER_PERMISSIONS
 
 
 def is_school_email(email: str):
@@ -11,3 +17,31 @@ def is_school_email(email: str):
         return email.endswith(SCHOOL_EMAIL_DOMAIN)
     except exceptions.ValidationError:
         return False
+
+
+@cache
+def get_default_user_permission_ids() -> tuple[int, ...]:
+    """
+    Get ids of the default permissions for all users.
+
+    Only queried once per process, cleared after migrations or when a
+    permission is deleted, since permissions can be recreated.
+    """
+
+    return tuple(perm.id for perm in parse_permissions(DEFAULT_USER_PERMISSIONS))
+
+
+@cache
+def get_global_perm_backends() -> tuple:
+    """
+    Get auth backends that can check global permissions.
+
+    Backends are loaded once per process, cleared if the
+    AUTHENTICATION_BACKENDS setting changes.
+    """
+
+    return tuple(
+        backend
+        for backend in auth.get_backends()
+        if hasattr(backend, "has_global_perm")
+    )
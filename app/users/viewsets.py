@@ -10,9 +10,13 @@ from allauth.socialaccount.models import SocialAccount
 from core.abstracts.viewsets import ModelViewSetBase, ViewSetBase
 from django.core import exceptions
 from django.core.exceptions import BadRequest
+from django.db.models import prefetch_related_objects
 from django.http import HttpRequest
 from django.shortcuts import redirect
 from django.urls import reverse, reverse_lazy
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_headers
 from drf_spectacular.utils import extend_schema
 from lib.allauth import OauthProviderType
 from rest_framework import authentication, generics, mixins, permissions, status
@@ -36,12 +40,22 @@ from users.serializers import (
 )
 from users.services import UserService
 
+# Relations read by UserSerializer and its computed fields
+USER_SERIALIZER_PREFETCH = (
+    "club_memberships__club",
+    "club_memberships__roles__permissions__content_type",
+    "socials",
+    "verified_emails",
+)
+
 
 class UserViewSet(mixins.RetrieveModelMixin, ViewSetBase):
     """Create a new user in the system."""
 
     serializer_class = UserSerializer
-    queryset = User.objects.all()
+    queryset = User.objects.select_related("profile").prefetch_related(
+        *USER_SERIALIZER_PREFETCH
+    )
 
 
 class PublicUserViewSet(mixins.CreateModelMixin, ViewSetBase):
@@ -111,7 +125,10 @@ class ManageUserView(generics.RetrieveUpdateAPIView):
 
     def get_object(self):
         """Retrieve and return the authenticated user."""
-        return self.request.user
+        user = self.request.user
+        prefetch_related_objects([user], *USER_SERIALIZER_PREFETCH)
+
+        return user
 
 
 class OauthDirectoryView(generics.RetrieveAPIView):
@@ -124,6 +141,12 @@ class OauthDirectoryView(generics.RetrieveAPIView):
 
     serializer_class = OauthDirectorySerializer
 
+    # Directory only changes on deploy, cache for 15 minutes (per Authorization header)
+    @method_decorator(cache_page(60 * 15))
+    @method_decorator(vary_on_headers("Authorization"))
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
     def get_object(self):
         """List available oauth providers, all will have the same url."""
         return {
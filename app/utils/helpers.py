@@ -1,3 +1,4 @@
+import csv
 import re
 from typing import Optional
 from urllib.parse import urljoin
@@ -106,8 +107,13 @@ def str_to_list(target: str | None):
     if not isinstance(target, str):
         return []
 
-    # items = target.split(r',(?=(?:[^"]*"[^"]*")*[^"]*$)')
-    items = re.split(',(?=(?:[^"]*"[^"]*")*[^"]*$)', target)
+    try:
+        # Uses the C csv parser, quotes may follow a space after the comma
+        items = next(csv.reader([target], skipinitialspace=True), [])
+    except csv.Error:
+        # Unquoted line breaks or very long values, split with a regex instead
+        items = re.split(',(?=(?:[^"]*"[^"]*")*[^"]*$)', target)
+
     items = clean_list([str(item).strip().replace('"', "") for item in items])
 
     return items